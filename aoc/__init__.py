@@ -1,9 +1,27 @@
 """Advent of Code helper utilities."""
 
+import os
 from pathlib import Path
 
 PACKAGE_ROOT = Path(__file__).resolve().parent
 PROJECT_ROOT = PACKAGE_ROOT.parent
 YEARS_DIR = PACKAGE_ROOT / "years"
+CACHE_DIR = Path(os.environ.get("AOC_CACHE_DIR", PROJECT_ROOT / ".aoc_cache"))
 
-__all__ = ["YEARS_DIR", "PROJECT_ROOT"]
+__all__ = ["CACHE_DIR", "YEARS_DIR", "PROJECT_ROOT", "atomic_write"]
+
+
+def atomic_write(path: Path, data: bytes | str) -> None:
+    """Write ``data`` to ``path`` through a temporary sibling and ``os.replace``.
+
+    Concurrent readers (pool workers, a second CLI run) see either the old file or
+    the complete new one, never a partial write.
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    if isinstance(data, str):
+        tmp_path.write_text(data, encoding="utf-8")
+    else:
+        tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
@@ -0,0 +1,12 @@
+"""Optional dependencies, imported once for the whole package.
+
+``numpy`` is the module when the ``numpy`` extra is installed (``pip install .[numpy]``)
+and ``None`` otherwise; callers test ``numpy is None`` and fall back to pure Python.
+"""
+
+from __future__ import annotations
+
+try:  # optional dependency
+    import numpy
+except ImportError:  # pragma: no cover - exercised only without numpy
+    numpy = None  # type: ignore[assignment]
@@ -2,12 +2,24 @@
 
 from __future__ import annotations
 
+import atexit
+import codecs
+import hashlib
+import mmap
+import os
+import pickle
+import re
+import shutil
+import sys
+import tempfile
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from array import array
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, ClassVar
 
-from . import YEARS_DIR
+from . import CACHE_DIR, YEARS_DIR, atomic_write
 
 
 @dataclass(slots=True, frozen=True)
@@ -26,15 +38,320 @@ class ChallengeIdentity:
         return YEARS_DIR / f"y{self.year}" / "inputs" / f"day{self.day:02d}.txt"
 
 
+def digest_bytes(payload: bytes) -> str:
+    """Return the hex digest used for every content-addressed cache key."""
+
+    return hashlib.sha256(payload).hexdigest()
+
+
+def module_source_digest(cls: type) -> str:
+    """Digest the source file of the module that defines ``cls``."""
+
+    module = sys.modules.get(cls.__module__)
+    source_file = getattr(module, "__file__", None)
+    if source_file is None:
+        return digest_bytes(cls.__qualname__.encode("utf-8"))
+    return digest_bytes(Path(source_file).read_bytes())
+
+
+#: ``--input -`` reads the puzzle input from standard input.
+STDIN_PATH = Path("-")
+DEFAULT_CHUNK_SIZE = 1 << 20
+#: Inputs at least this large index their lines with NumPy when it is installed;
+#: below it, importing NumPy costs more than the scan it speeds up.
+_NUMPY_LINE_INDEX_BYTES = 1 << 24
+_NEWLINE = re.compile(b"\n")
+_stdin_spool: Path | None = None
+
+
+def _spool_stdin() -> Path:
+    """Copy standard input to a temporary file once so it can be read repeatedly."""
+
+    global _stdin_spool
+    if _stdin_spool is None:
+        handle, name = tempfile.mkstemp(prefix="aoc-stdin-", suffix=".txt")
+        with os.fdopen(handle, "wb") as spool:
+            shutil.copyfileobj(sys.stdin.buffer, spool, DEFAULT_CHUNK_SIZE)
+        _stdin_spool = Path(name)
+        atexit.register(_stdin_spool.unlink, missing_ok=True)
+    return _stdin_spool
+
+
+class InputStream:
+    """Re-iterable, constant-memory view of an input file.
+
+    Iterating yields lines without their line endings, exactly like
+    ``read_input`` would, but only one buffered chunk is held at a time.
+    Every iteration re-opens the file, so both parts can walk it independently.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        buffer: memoryview | None = None,
+    ):
+        self.path = path
+        self.chunk_size = chunk_size
+        #: When set, blocks are copied out of this buffer instead of read from ``path``.
+        self.buffer = buffer
+
+    def __iter__(self) -> Iterator[str]:
+        return self.lines()
+
+    def _blocks(self) -> Iterator[bytes]:
+        if self.buffer is not None:
+            for start in range(0, len(self.buffer), self.chunk_size):
+                yield bytes(self.buffer[start : start + self.chunk_size])
+            return
+        with self.path.open("rb") as handle:
+            while block := handle.read(self.chunk_size):
+                yield block
+
+    def chunks(self) -> Iterator[bytes]:
+        """Yield raw byte blocks that always end on a line boundary."""
+
+        remainder = b""
+        for block in self._blocks():
+            block = remainder + block
+            cut = block.rfind(b"\n") + 1
+            if cut == 0:
+                remainder = block
+                continue
+            remainder = block[cut:]
+            yield block[:cut]
+        if remainder:
+            yield remainder
+
+    def lines(self) -> Iterator[str]:
+        for block in self.chunks():
+            yield from block.decode("utf-8").splitlines()
+
+    def records(self, sep: str) -> Iterator[str]:
+        """Yield the text between occurrences of ``sep`` (a trailing empty record is dropped)."""
+
+        if not sep:
+            raise ValueError("Record separator must not be empty.")
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        pending = ""
+        for block in self._blocks():
+            pending += decoder.decode(block)
+            *complete, pending = pending.split(sep)
+            yield from complete
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            yield pending
+
+
+def _line_starts(data: bytes | mmap.mmap) -> array:
+    """Offsets of every line start plus one past the newline ending (or that would end) the last."""
+
+    size = len(data)
+    # The sentinel can be size + 1, which must still fit the typecode.
+    starts = array("I" if size + 1 < 1 << 32 else "Q")
+    if not size:
+        return starts
+    starts.append(0)
+    numpy = None
+    if size >= _NUMPY_LINE_INDEX_BYTES:
+        from ._compat import numpy
+    if numpy is not None:
+        newlines = numpy.flatnonzero(numpy.frombuffer(data, dtype=numpy.uint8) == 0x0A)
+        starts.frombytes((newlines + 1).astype(f"u{starts.itemsize}").tobytes())
+    else:
+        # One match object per line but no line copies; the loop itself runs in C.
+        starts.extend(map(re.Match.end, _NEWLINE.finditer(data)))
+    if data[size - 1] != 0x0A:
+        starts.append(size + 1)
+    return starts
+
+
+class RawInput(Sequence[str]):
+    """The whole input as one ``bytes`` (or ``mmap``) buffer plus an index of line starts.
+
+    ``starts`` is an ``array('I')`` (``'Q'`` past 4 GiB) holding one offset per line
+    and a final sentinel, so the input costs two flat buffers instead of one ``str``
+    object per line; it is only built once lines are accessed. :meth:`line_bytes`
+    returns zero-copy ``memoryview`` slices; indexing and iteration decode lines to
+    ``str`` on demand, so solutions written against ``list[str]`` keep working
+    unchanged. Line endings follow ``str.splitlines`` for ``\n`` and ``\r\n`` files.
+    """
+
+    def __init__(self, data: bytes | mmap.mmap):
+        self.data = data
+        self._view = memoryview(data)
+        self._starts: array | None = None
+
+    @property
+    def starts(self) -> array:
+        """Line start offsets plus a sentinel, built on first use.
+
+        Whole-buffer parsers (see :mod:`aoc.parsing`) never touch lines, so they
+        never pay for the index.
+        """
+
+        if self._starts is None:
+            self._starts = _line_starts(self.data)
+        return self._starts
+
+    @classmethod
+    def from_path(cls, path: Path, *, use_mmap: bool = False) -> RawInput:
+        """Read ``path`` whole, or map it read-only with ``use_mmap`` (call :meth:`close` after)."""
+
+        if not use_mmap:
+            return cls(path.read_bytes())
+        with path.open("rb") as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                return cls(b"")
+            return cls(mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __len__(self) -> int:
+        return max(len(self.starts) - 1, 0)
+
+    def _bounds(self, index: int) -> tuple[int, int]:
+        start, end = self.starts[index], self.starts[index + 1] - 1
+        if end > start and self.data[end - 1] == 13:  # strip the "\r" of "\r\n"
+            end -= 1
+        return start, end
+
+    def line_bytes(self, index: int) -> memoryview:
+        """Return line ``index`` without its line ending, as a view into the buffer."""
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("line index out of range")
+        start, end = self._bounds(index)
+        return self._view[start:end]
+
+    def iter_bytes(self) -> Iterator[memoryview]:
+        view, bounds = self._view, self._bounds
+        for index in range(len(self)):
+            start, end = bounds(index)
+            yield view[start:end]
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [str(self.line_bytes(i), "utf-8") for i in range(*index.indices(len(self)))]
+        return str(self.line_bytes(index), "utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        for line in self.iter_bytes():
+            yield str(line, "utf-8")
+
+    def text(self) -> str:
+        """Decode the whole buffer at once."""
+
+        return str(self._view, "utf-8")
+
+    def close(self) -> None:
+        """Release the buffer view and unmap an ``mmap``-backed input."""
+
+        self._view.release()
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+    def __enter__(self) -> RawInput:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __reduce__(self):
+        # Memoryviews and maps cannot be pickled; the parsed-input cache needs the bytes.
+        return (RawInput, (bytes(self._view),))
+
+
+class ParsedInputCache:
+    """Opt-in on-disk store of parsed inputs, evicted least-recently-used by total size.
+
+    Entries live under ``<root>/<slug>/`` and are keyed by the digest of the input
+    bytes plus the digests of the solution module and the shared ``aoc`` package
+    sources, so editing any of them produces a miss instead of a stale hit. Recency
+    is tracked through file mtimes.
+    """
+
+    def __init__(self, root: Path | None = None, *, max_bytes: int = 256 * 1024 * 1024):
+        self.root = root or CACHE_DIR / "parsed"
+        self.max_bytes = max_bytes
+
+    def entry_path(self, challenge: BaseChallenge, input_bytes: bytes) -> Path:
+        from .cache import package_source_digest  # aoc.cache imports this module
+
+        input_digest = digest_bytes(input_bytes)[:16]
+        # Parsers also live in shared modules (aoc.parsing, aoc.grid), not only the day.
+        source = "\0".join((module_source_digest(type(challenge)), package_source_digest()))
+        source_digest = digest_bytes(source.encode())[:16]
+        return self.root / challenge.identity.slug / f"{input_digest}-{source_digest}.pickle"
+
+    def load(self, path: Path) -> tuple[bool, Any]:
+        """Return ``(hit, value)`` for ``path``; unreadable entries count as misses."""
+
+        try:
+            payload = path.read_bytes()
+        except FileNotFoundError:
+            return False, None
+        try:
+            value = pickle.loads(payload)
+        except Exception:  # noqa: BLE001 - a corrupt entry is just a miss
+            path.unlink(missing_ok=True)
+            return False, None
+        os.utime(path)
+        return True, value
+
+    def store(self, path: Path, value: Any) -> None:
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return  # Unpicklable parse results simply are not cached.
+        if len(payload) > self.max_bytes:
+            return
+
+        atomic_write(path, payload)
+        self.evict()
+
+    def evict(self) -> None:
+        """Drop the least recently used entries until the cache fits ``max_bytes``."""
+
+        entries = []
+        for entry in self.root.glob("*/*.pickle"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+
+
 class BaseChallenge(ABC):
     """Common functionality shared by every daily puzzle implementation."""
 
     #: Override in subclasses or pass explicitly via ``identity``.
     identity = ChallengeIdentity(year=2025, day=1)
 
+    #: ``"lines"`` parses the whole file as ``list[str]``; ``"stream"`` hands
+    #: :meth:`parse` an :class:`InputStream` so single-pass solutions never
+    #: hold the full input in memory; ``"raw"`` hands it a :class:`RawInput`.
+    input_mode: ClassVar[str] = "lines"
+
+    #: Garbage collector behaviour while solving (see :mod:`aoc.gctune`); ``--gc``
+    #: overrides it. Allocation-heavy days can default to ``"freeze"`` or ``"off"``.
+    gc_mode: ClassVar[str] = "default"
+
     def __init__(self, *, identity: ChallengeIdentity | None = None, input_path: Path | None = None):
         self.identity = identity or self.identity
+        if input_path == STDIN_PATH:
+            # Spool eagerly: child processes (isolation, pools) cannot read our stdin.
+            input_path = _spool_stdin()
         self._input_override = input_path
+        self._input_buffer: memoryview | None = None
 
     # ------------------------------------------------------------------
     # Input helpers
@@ -50,27 +367,121 @@ class BaseChallenge(ABC):
             return base_path
         return base_path.parent / filename
 
-    def read_input(self, *, filename: str | None = None) -> list[str]:
-        """Read the requested input file and return a list of stripped lines."""
-
+    def _existing_input_path(self, *, filename: str | None = None) -> Path:
         path = self.resolve_input_path(filename=filename)
         if not path.exists():
             raise FileNotFoundError(
                 f"Input file not found for {self.identity.slug}: {path}. "
                 "Create it or supply --input when running the CLI."
             )
-        return path.read_text(encoding="utf-8").splitlines()
+        return path
+
+    def use_input_buffer(self, buffer: memoryview | None) -> None:
+        """Serve the main input from ``buffer`` (e.g. shared memory) instead of the file.
+
+        Sibling files requested with ``filename`` are still read from disk. Pass
+        ``None`` to detach before the buffer is released.
+        """
+
+        self._input_buffer = buffer
+
+    def read_input_bytes(self, *, filename: str | None = None) -> bytes:
+        """Read the requested input file verbatim."""
+
+        if self._input_buffer is not None and filename is None:
+            return bytes(self._input_buffer)
+        return self._existing_input_path(filename=filename).read_bytes()
+
+    def input_digest(self) -> str:
+        """Digest the input file without loading it into memory at once."""
+
+        if self._input_buffer is not None:
+            return hashlib.sha256(self._input_buffer).hexdigest()
+        with self._existing_input_path().open("rb") as handle:
+            return hashlib.file_digest(handle, "sha256").hexdigest()
+
+    def input_stream(self, *, filename: str | None = None) -> InputStream:
+        """Return a re-iterable, chunk-buffered view of the input file."""
+
+        if self._input_buffer is not None and filename is None:
+            return InputStream(self.resolve_input_path(), buffer=self._input_buffer)
+        return InputStream(self._existing_input_path(filename=filename))
+
+    def iter_lines(self) -> Iterator[str]:
+        """Yield input lines one at a time using buffered chunked reads."""
+
+        return self.input_stream().lines()
+
+    def iter_records(self, sep: str) -> Iterator[str]:
+        """Yield input records split on ``sep`` (e.g. ``","`` or ``"\\n\\n"``) while streaming."""
+
+        return self.input_stream().records(sep)
+
+    def read_input(self, *, filename: str | None = None) -> list[str]:
+        """Read the requested input file and return a list of stripped lines."""
+
+        if self._input_buffer is not None and filename is None:
+            return str(self._input_buffer, "utf-8").splitlines()
+        return self.read_input_bytes(filename=filename).decode("utf-8").splitlines()
+
+    def raw_input(self, *, filename: str | None = None, use_mmap: bool = False) -> RawInput:
+        """Return the input as one buffer with a line-offset index (see :class:`RawInput`)."""
+
+        if self._input_buffer is not None and filename is None:
+            return RawInput(bytes(self._input_buffer))
+        return RawInput.from_path(self._existing_input_path(filename=filename), use_mmap=use_mmap)
+
+    def parse_input(self, *, cache: ParsedInputCache | None = None) -> Any:
+        """Read the input and run :meth:`parse`, reusing a cached result when possible.
+
+        The cache is only consulted for subclasses that override :meth:`parse`;
+        caching the raw lines would cost more than re-splitting them. Streaming
+        challenges receive an :class:`InputStream` and are never cached.
+        """
+
+        if self.input_mode not in ("lines", "stream", "raw"):
+            raise ValueError(
+                f"{type(self).__name__}.input_mode must be 'lines', 'stream' or 'raw', "
+                f"not {self.input_mode!r}."
+            )
+        if self.input_mode == "stream":
+            return self.parse(self.input_stream())
+        if cache is None or type(self).parse is BaseChallenge.parse:
+            return self.parse(self.raw_input() if self.input_mode == "raw" else self.read_input())
+
+        payload = self.read_input_bytes()
+        entry = cache.entry_path(self, payload)
+        hit, data = cache.load(entry)
+        if hit:
+            return data
+        if self.input_mode == "raw":
+            data = self.parse(RawInput(payload))
+        else:
+            data = self.parse(payload.decode("utf-8").splitlines())
+        cache.store(entry, data)
+        return data
 
     # ------------------------------------------------------------------
     # Solution contract
     # ------------------------------------------------------------------
+    def parse(self, lines: list[str]) -> Any:
+        """Turn the input lines into the structure both parts consume.
+
+        Runs once per execution and its result is shared by ``solve_part1`` and
+        ``solve_part2``, so parts must treat it as read-only. The default passes
+        the lines through unchanged. With ``input_mode = "stream"`` it receives
+        an :class:`InputStream` instead of a list, with ``"raw"`` a :class:`RawInput`.
+        """
+
+        return lines
+
     @abstractmethod
-    def solve_part1(self, data: Sequence[str]) -> str:
-        """Return the answer for part 1."""
+    def solve_part1(self, data: Any) -> str:
+        """Return the answer for part 1, given the output of :meth:`parse`."""
 
     @abstractmethod
-    def solve_part2(self, data: Sequence[str]) -> str:
-        """Return the answer for part 2."""
+    def solve_part2(self, data: Any) -> str:
+        """Return the answer for part 2, given the output of :meth:`parse`."""
 
     # ------------------------------------------------------------------
     # Convenience entry point
@@ -78,11 +489,11 @@ class BaseChallenge(ABC):
     def run(self, *, part: str | None = None) -> dict[str, str]:
         """Execute one or both parts and return the answers."""
 
-        lines = self.read_input()
+        data = self.parse_input()
         results: dict[str, str] = {}
 
         if part in (None, "1"):
-            results["part1"] = self.solve_part1(lines)
+            results["part1"] = self.solve_part1(data)
         if part in (None, "2"):
-            results["part2"] = self.solve_part2(lines)
+            results["part2"] = self.solve_part2(data)
         return results
\ No newline at end of file
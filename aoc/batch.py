@@ -0,0 +1,129 @@
+"""Run one day over many input files across a process pool, yielding results as they finish."""
+
+from __future__ import annotations
+
+import glob
+import importlib
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from .base import BaseChallenge, ChallengeIdentity, ParsedInputCache
+from .cache import ResultCache
+from .isolation import IsolationLimits
+from .runner import PartResult, _locate_challenge_class, challenge_module_name, run_challenge
+
+#: Set once per worker by :func:`_init_worker`; every input reuses it.
+_challenge_cls: type[BaseChallenge] | None = None
+_identity: ChallengeIdentity | None = None
+
+
+@dataclass(slots=True)
+class InputResult:
+    input: Path
+    wall_ms: float
+    results: list[PartResult] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and all(result.status == "ok" for result in self.results)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "input": str(self.input),
+            "ok": self.ok,
+            "wall_ms": round(self.wall_ms, 3),
+            "error": self.error,
+            "parts": [
+                {key: value for key, value in asdict(result).items() if key != "profile"}
+                for result in self.results
+            ],
+        }
+
+
+def expand_input_glob(pattern: str) -> list[Path]:
+    """Return the files matching ``pattern`` (``**`` recurses), sorted for stable output."""
+
+    return sorted(Path(match) for match in glob.glob(pattern, recursive=True) if Path(match).is_file())
+
+
+def _init_worker(year: int, day: int) -> None:
+    """Pool initializer: import the solution module once per worker process."""
+
+    global _challenge_cls, _identity
+    module = importlib.import_module(challenge_module_name(year, day))
+    _challenge_cls = _locate_challenge_class(module)
+    _identity = ChallengeIdentity(year=year, day=day)
+
+
+def _run_input(
+    input_path: Path,
+    part: str | None,
+    parse_cache: ParsedInputCache | None,
+    result_cache: ResultCache | None,
+    refresh: bool,
+    track_memory: bool,
+    isolation: IsolationLimits | None,
+    gc_mode: str | None,
+) -> InputResult:
+    start = perf_counter()
+    try:
+        challenge = _challenge_cls(identity=_identity, input_path=input_path)
+        results = run_challenge(
+            challenge,
+            part=part,
+            parse_cache=parse_cache,
+            result_cache=result_cache,
+            refresh=refresh,
+            track_memory=track_memory,
+            isolation=isolation,
+            gc_mode=gc_mode,
+        )
+    except Exception as exc:  # noqa: BLE001 - one bad input must not sink the batch
+        wall_ms = (perf_counter() - start) * 1000
+        return InputResult(input=input_path, wall_ms=wall_ms, error=f"{type(exc).__name__}: {exc}")
+    return InputResult(input=input_path, wall_ms=(perf_counter() - start) * 1000, results=results)
+
+
+def run_batch(
+    year: int,
+    day: int,
+    inputs: Sequence[Path],
+    *,
+    part: str | None = None,
+    jobs: int | None = None,
+    parse_cache: ParsedInputCache | None = None,
+    result_cache: ResultCache | None = None,
+    refresh: bool = False,
+    track_memory: bool = False,
+    isolation: IsolationLimits | None = None,
+    gc_mode: str | None = None,
+) -> Iterator[InputResult]:
+    """Solve ``day`` for every path in ``inputs``, yielding each result as soon as it completes."""
+
+    # Import in the parent too: a broken module fails here with its own traceback
+    # instead of as a BrokenProcessPool, and forked workers inherit the import.
+    _init_worker(year, day)
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(year, day)
+    ) as pool:
+        futures = [
+            pool.submit(
+                _run_input,
+                input_path,
+                part,
+                parse_cache,
+                result_cache,
+                refresh,
+                track_memory,
+                isolation,
+                gc_mode,
+            )
+            for input_path in inputs
+        ]
+        for future in as_completed(futures):
+            yield future.result()
@@ -0,0 +1,222 @@
+"""Repeated-run benchmarking for Advent of Code challenges."""
+
+from __future__ import annotations
+
+import json
+import math
+import platform
+import statistics
+import tempfile
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .base import BaseChallenge
+from .gen import fit_growth_exponent, write_input
+from .runner import load_challenge, parts_to_run, prepare_input, select_solver, time_solver
+
+#: Growth exponents above this are flagged as superlinear.
+SUPERLINEAR_THRESHOLD = 1.15
+#: Parts whose slowest median stays under this are too fast to fit meaningfully.
+NOISE_FLOOR_MS = 1.0
+
+
+@dataclass(slots=True)
+class BenchResult:
+    part: str
+    answer: str
+    samples_ms: list[float] = field(default_factory=list)
+
+    @property
+    def min_ms(self) -> float:
+        return min(self.samples_ms)
+
+    @property
+    def mean_ms(self) -> float:
+        return statistics.fmean(self.samples_ms)
+
+    @property
+    def median_ms(self) -> float:
+        return statistics.median(self.samples_ms)
+
+    @property
+    def p95_ms(self) -> float:
+        # Nearest-rank percentile: always one of the observed samples.
+        ordered = sorted(self.samples_ms)
+        rank = max(1, math.ceil(0.95 * len(ordered)))
+        return ordered[rank - 1]
+
+    @property
+    def stddev_ms(self) -> float:
+        if len(self.samples_ms) < 2:
+            return 0.0
+        return statistics.stdev(self.samples_ms)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "part": self.part,
+            "answer": self.answer,
+            "min_ms": self.min_ms,
+            "median_ms": self.median_ms,
+            "p95_ms": self.p95_ms,
+            "mean_ms": self.mean_ms,
+            "stddev_ms": self.stddev_ms,
+            "samples_ms": list(self.samples_ms),
+        }
+
+
+def bench_challenge(
+    challenge: BaseChallenge,
+    *,
+    part: str | None = None,
+    warmup: int = 1,
+    iterations: int = 10,
+) -> list[BenchResult]:
+    """Time parsing and each requested part ``iterations`` times after ``warmup`` untimed runs.
+
+    The first entry (``part == "parse"``) covers reading plus :meth:`BaseChallenge.parse`;
+    the solver entries reuse one parsed input, exactly as :func:`run_challenge` does.
+    """
+
+    if iterations < 1:
+        raise ValueError("iterations must be at least 1.")
+    if warmup < 0:
+        raise ValueError("warmup must not be negative.")
+
+    for _ in range(warmup):
+        prepare_input(challenge)
+    parse_result = BenchResult(part="parse", answer="")
+    for _ in range(iterations):
+        data, parse_ms = prepare_input(challenge)
+        parse_result.samples_ms.append(parse_ms)
+
+    results: list[BenchResult] = [parse_result]
+    for current_part in parts_to_run(part):
+        solver = select_solver(challenge, current_part)
+        for _ in range(warmup):
+            solver(data)
+
+        result = BenchResult(part=current_part, answer="")
+        for _ in range(iterations):
+            answer, duration_ms = time_solver(solver, data)
+            result.answer = answer
+            result.samples_ms.append(duration_ms)
+        results.append(result)
+    return results
+
+
+def bench_to_json(
+    challenge: BaseChallenge,
+    results: Iterable[BenchResult],
+    *,
+    warmup: int,
+    iterations: int,
+) -> str:
+    """Serialize benchmark results so they can be compared across commits."""
+
+    payload = {
+        "slug": challenge.identity.slug,
+        "year": challenge.identity.year,
+        "day": challenge.identity.day,
+        "warmup": warmup,
+        "iterations": iterations,
+        "python": platform.python_version(),
+        "parts": [result.to_dict() for result in results],
+    }
+    return json.dumps(payload, indent=2)
+
+
+def format_bench(results: Iterable[BenchResult]) -> str:
+    """Return a printable table summarizing the benchmark statistics."""
+
+    lines = ["===== Advent of Code Bench ====="]
+    for result in results:
+        if result.part == "parse":
+            lines.append("Parse:")
+        else:
+            lines.append(f"Part {result.part}: {result.answer}")
+        lines.append(
+            f"  min {result.min_ms:.2f} ms | median {result.median_ms:.2f} ms | "
+            f"p95 {result.p95_ms:.2f} ms | stddev {result.stddev_ms:.2f} ms "
+            f"({len(result.samples_ms)} runs)"
+        )
+    lines.append("================================")
+    return "\n".join(lines)
+
+
+@dataclass(slots=True)
+class ScalingReport:
+    slug: str
+    sizes: list[int]
+    #: ``{"parse" | "1" | "2": [median ms per size]}``
+    medians_ms: dict[str, list[float]]
+
+    def exponents(self) -> dict[str, float | None]:
+        return {
+            part: (
+                fit_growth_exponent(self.sizes, medians)
+                if max(medians, default=0.0) >= NOISE_FLOOR_MS
+                else None
+            )
+            for part, medians in self.medians_ms.items()
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "slug": self.slug,
+            "python": platform.python_version(),
+            "sizes": list(self.sizes),
+            "medians_ms": {part: list(medians) for part, medians in self.medians_ms.items()},
+            "exponents": self.exponents(),
+            "superlinear_threshold": SUPERLINEAR_THRESHOLD,
+        }
+
+
+def bench_scaling(
+    year: int,
+    day: int,
+    sizes: Sequence[int],
+    *,
+    part: str | None = None,
+    warmup: int = 0,
+    iterations: int = 3,
+    seed: int = 0,
+) -> ScalingReport:
+    """Benchmark a day on generated inputs of each size and collect median timings."""
+
+    medians: dict[str, list[float]] = {}
+    slug = ""
+    with tempfile.TemporaryDirectory(prefix="aoc-scale-") as workdir:
+        for size in sizes:
+            path = write_input(year, day, size, Path(workdir) / f"n{size}.txt", seed=seed)
+            challenge = load_challenge(year, day, input_path=path)
+            slug = challenge.identity.slug
+            results = bench_challenge(challenge, part=part, warmup=warmup, iterations=iterations)
+            for result in results:
+                medians.setdefault(result.part, []).append(result.median_ms)
+            path.unlink()
+    return ScalingReport(slug=slug, sizes=list(sizes), medians_ms=medians)
+
+
+def format_scaling(report: ScalingReport) -> str:
+    """Return a size-by-part table of median timings plus the fitted growth exponents."""
+
+    columns = list(report.medians_ms)
+    labels = ["parse" if column == "parse" else f"part {column}" for column in columns]
+    lines = [f"===== Advent of Code Scaling: {report.slug} ====="]
+    lines.append(f"{'n':>12} " + " ".join(f"{label:>14}" for label in labels))
+    for index, size in enumerate(report.sizes):
+        cells = " ".join(f"{report.medians_ms[column][index]:>11.2f} ms" for column in columns)
+        lines.append(f"{size:>12} {cells}")
+
+    fitted: list[str] = []
+    for label, exponent in zip(labels, report.exponents().values()):
+        if exponent is None:
+            fitted.append(f"{label} n/a (< {NOISE_FLOOR_MS:g} ms)")
+            continue
+        flag = " (superlinear)" if exponent > SUPERLINEAR_THRESHOLD else ""
+        fitted.append(f"{label} {exponent:.2f}{flag}")
+    lines.append("Growth exponent: " + ", ".join(fitted))
+    lines.append("=" * len(lines[0]))
+    return "\n".join(lines)
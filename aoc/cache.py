@@ -0,0 +1,56 @@
+"""Answer memoization keyed by solution source, framework source and input digest."""
+
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from . import CACHE_DIR, PACKAGE_ROOT, atomic_write
+from .base import BaseChallenge, digest_bytes, module_source_digest
+
+
+@lru_cache(maxsize=1)
+def package_source_digest() -> str:
+    """Digest every top-level ``aoc`` module a solution can depend on."""
+
+    parts = []
+    for path in sorted(PACKAGE_ROOT.glob("*.py")):
+        parts.append(path.name.encode("utf-8"))
+        parts.append(digest_bytes(path.read_bytes()).encode("ascii"))
+    return digest_bytes(b"\0".join(parts))
+
+
+class ResultCache:
+    """Stores one JSON file per ``(challenge, part)`` answer under ``<root>/<slug>/``.
+
+    A stored answer is only returned while the solution module, the shared ``aoc``
+    package modules and the input bytes are all byte-for-byte unchanged.
+    """
+
+    def __init__(self, root: Path | None = None):
+        self.root = root or CACHE_DIR / "results"
+
+    def entry_path(self, challenge: BaseChallenge, part: str, input_digest: str) -> Path:
+        key = "\0".join(
+            (
+                module_source_digest(type(challenge)),
+                package_source_digest(),
+                input_digest,
+                part,
+            )
+        )
+        return self.root / challenge.identity.slug / f"part{part}-{digest_bytes(key.encode())[:32]}.json"
+
+    def load(self, path: Path) -> dict[str, Any] | None:
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            path.unlink(missing_ok=True)
+            return None
+
+    def store(self, path: Path, record: dict[str, Any]) -> None:
+        atomic_write(path, json.dumps(record))
@@ -4,16 +4,37 @@ from __future__ import annotations
 
 import argparse
 import sys
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from .runner import format_results, load_challenge, run_challenge
+if TYPE_CHECKING:
+    from .base import ParsedInputCache
+    from .cache import ResultCache
+    from .isolation import IsolationLimits
+    from .runner import PartResult
 
+# Framework modules are imported inside the command handlers so that cheap commands
+# such as 'aoc list' never pay for multiprocessing, hashlib or the solution modules.
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description="Run Advent of Code solutions without hassle.")
+
+def _day_argument(value: str) -> int | str:
+    if value == "all":
+        return value
+    try:
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a day number or 'all', got {value!r}") from None
+
+
+def _add_target_arguments(parser: argparse.ArgumentParser, *, allow_all: bool = False) -> None:
     parser.add_argument("year", type=int, help="Target year, e.g. 2025")
-    parser.add_argument("day", type=int, help="Target day, e.g. 1")
+    if allow_all:
+        parser.add_argument(
+            "day", type=_day_argument, help="Target day, e.g. 1, or 'all' for every solved day"
+        )
+    else:
+        parser.add_argument("day", type=int, help="Target day, e.g. 1")
     parser.add_argument(
         "--part",
         choices=["1", "2", "both"],
@@ -25,18 +46,561 @@ def build_parser() -> argparse.ArgumentParser:
         type=Path,
         help="Optional path to override the default input file.",
     )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    from .gctune import GC_MODES
+
+    parser = argparse.ArgumentParser(
+        description="Run Advent of Code solutions without hassle.",
+        epilog=(
+            "Subcommands: 'aoc list [YEAR]' to show solved days, "
+            "'aoc bench YEAR DAY' for repeated timings, "
+            "'aoc history YEAR DAY' for recorded timings, "
+            "'aoc check' to gate on performance regressions, "
+            "'aoc serve' for a warm solver daemon."
+        ),
+    )
+    _add_target_arguments(parser, allow_all=True)
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        help="Worker processes for 'all' or --input-glob (default: one per CPU).",
+    )
+    parser.add_argument(
+        "--parse-cache",
+        action="store_true",
+        help="Reuse parsed inputs stored on disk, keyed by input, solution and package source hashes.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always recompute answers instead of reusing ones stored for unchanged code and input.",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Recompute answers and overwrite the stored results.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Run each part under cProfile and print the functions with the most cumulative time.",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=25,
+        metavar="N",
+        help="Number of functions listed per part with --profile (default: 25).",
+    )
+    parser.add_argument(
+        "--profile-output",
+        type=Path,
+        metavar="PATH",
+        help="With --profile, also write collapsed stacks for flame-graph tools to PATH.",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Report per-part peak traced memory, net allocations and max RSS (slows solvers down).",
+    )
+    parser.add_argument(
+        "--isolate",
+        action="store_true",
+        help="Run each part in its own child process; implied by --timeout and --max-memory.",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        metavar="SECONDS",
+        help="Kill an isolated part after this many wall-clock seconds.",
+    )
+    parser.add_argument(
+        "--max-memory",
+        type=int,
+        metavar="MB",
+        help="Cap each isolated part's address space (RLIMIT_AS) at this many MiB.",
+    )
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Do not record fresh timings in the run history (.aoc_cache/history.sqlite3).",
+    )
+    parser.add_argument(
+        "--gc",
+        dest="gc_mode",
+        choices=GC_MODES,
+        help=(
+            "Garbage collector behaviour while solving: 'freeze' moves the parsed input out of "
+            "collection and collects less often, 'off' disables it (default: the day's own setting)."
+        ),
+    )
+    parser.add_argument(
+        "--concurrent",
+        action="store_true",
+        help="Solve both parts at the same time in two processes sharing the input in memory.",
+    )
+    parser.add_argument(
+        "--input-glob",
+        metavar="PATTERN",
+        help=(
+            "Run the day once per file matching PATTERN (e.g. 'inputs/day08/*.txt') across "
+            "--jobs workers, printing one JSON line per input as it finishes."
+        ),
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help=(
+            "Stay running and rerun the affected parts whenever the solution module or "
+            "input file changes, reusing the parsed input when only solver code changed."
+        ),
+    )
     return parser
 
 
+def build_bench_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="aoc bench",
+        description="Benchmark a solution with warmup runs and repeated timed iterations.",
+    )
+    _add_target_arguments(parser)
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=1,
+        help="Untimed runs per part before measuring (default: 1).",
+    )
+    parser.add_argument(
+        "--iterations",
+        "-n",
+        type=int,
+        default=10,
+        help="Timed runs per part (default: 10).",
+    )
+    parser.add_argument(
+        "--json",
+        dest="json_path",
+        metavar="PATH",
+        help="Write machine-readable results to PATH, or '-' to print JSON instead of the table.",
+    )
+    parser.add_argument(
+        "--scale",
+        metavar="SIZES",
+        help="Benchmark generated inputs of these sizes (e.g. 1e3,1e4,1e5) and fit a growth exponent.",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed for --scale input generation (default: 0).",
+    )
+    return parser
+
+
+def bench_main(argv: Sequence[str]) -> int:
+    from .bench import bench_challenge, bench_to_json, format_bench
+    from .runner import load_challenge
+
+    parser = build_bench_parser()
+    args = parser.parse_args(argv)
+    if args.iterations < 1:
+        parser.error("--iterations must be at least 1.")
+    if args.warmup < 0:
+        parser.error("--warmup must not be negative.")
+    if args.scale is not None:
+        return _bench_scaling(parser, args)
+
+    challenge = load_challenge(args.year, args.day, input_path=args.input)
+    results = bench_challenge(
+        challenge, part=args.part, warmup=args.warmup, iterations=args.iterations
+    )
+
+    if args.json_path is None:
+        print(format_bench(results))
+        return 0
+
+    payload = bench_to_json(challenge, results, warmup=args.warmup, iterations=args.iterations)
+    if args.json_path == "-":
+        print(payload)
+    else:
+        Path(args.json_path).write_text(payload + "\n", encoding="utf-8")
+        print(format_bench(results))
+    return 0
+
+
+def _bench_scaling(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    import json
+
+    from .bench import bench_scaling, format_scaling
+    from .gen import get_generator, parse_scales
+
+    if args.input is not None:
+        parser.error("--scale generates its own inputs; drop --input.")
+    try:
+        sizes = parse_scales(args.scale)
+    except ValueError as exc:
+        parser.error(str(exc))
+    try:
+        get_generator(args.year, args.day)
+    except LookupError as exc:
+        parser.error(str(exc))
+
+    report = bench_scaling(
+        args.year,
+        args.day,
+        sizes,
+        part=args.part,
+        warmup=args.warmup,
+        iterations=args.iterations,
+        seed=args.seed,
+    )
+    payload = json.dumps(report.to_dict(), indent=2)
+    if args.json_path == "-":
+        print(payload)
+        return 0
+    if args.json_path is not None:
+        Path(args.json_path).write_text(payload + "\n", encoding="utf-8")
+    print(format_scaling(report))
+    return 0
+
+
+def build_serve_parser() -> argparse.ArgumentParser:
+    from .client import DEFAULT_SOCKET
+
+    parser = argparse.ArgumentParser(
+        prog="aoc serve",
+        description=(
+            "Keep solution modules warm and answer 'python -m aoc.client YEAR DAY' requests "
+            "over a Unix socket. Edited modules are reloaded automatically."
+        ),
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=DEFAULT_SOCKET,
+        help=f"Unix socket path (default: {DEFAULT_SOCKET}, or $AOC_SOCKET).",
+    )
+    parser.add_argument(
+        "--no-preload",
+        action="store_true",
+        help="Import solution modules on first request instead of at startup.",
+    )
+    return parser
+
+
+def serve_main(argv: Sequence[str]) -> int:
+    from .server import serve
+
+    args = build_serve_parser().parse_args(argv)
+    serve(args.socket, preload=not args.no_preload)
+    return 0
+
+
+def build_list_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="aoc list",
+        description="List solution modules and which parts they implement, without importing them.",
+    )
+    parser.add_argument("year", type=int, nargs="?", help="Only list this year.")
+    return parser
+
+
+def list_main(argv: Sequence[str]) -> int:
+    from .index import SolutionIndex, format_index
+
+    args = build_list_parser().parse_args(argv)
+    print(format_index(SolutionIndex().entries(args.year)))
+    return 0
+
+
+def build_history_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="aoc history",
+        description="Show recorded timings for a day, oldest first, with a per-part trend.",
+    )
+    parser.add_argument("year", type=int, help="Target year, e.g. 2025")
+    parser.add_argument("day", type=int, help="Target day, e.g. 1")
+    parser.add_argument("--part", choices=["1", "2"], help="Only show one part.")
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=20,
+        metavar="N",
+        help="Show the N most recent runs (default: 20).",
+    )
+    return parser
+
+
+def history_main(argv: Sequence[str]) -> int:
+    from .base import ChallengeIdentity
+    from .history import RunHistory, format_history
+
+    args = build_history_parser().parse_args(argv)
+    slug = ChallengeIdentity(year=args.year, day=args.day).slug
+    runs = RunHistory().runs(slug_prefix=slug, part=args.part, limit=args.limit)
+    print(format_history(slug, runs))
+    return 0
+
+
+def build_check_parser() -> argparse.ArgumentParser:
+    from .history import DEFAULT_WINDOW
+
+    parser = argparse.ArgumentParser(
+        prog="aoc check",
+        description=(
+            "Exit non-zero when a part's latest recorded run is slower than the median "
+            "of its previous runs on the same input and in the same mode."
+        ),
+    )
+    parser.add_argument("year", type=int, nargs="?", help="Only check this year.")
+    parser.add_argument(
+        "--max-regression",
+        default="15%",
+        metavar="PCT",
+        help="Allowed slowdown over the baseline, e.g. 15%% (default: 15%%).",
+    )
+    parser.add_argument(
+        "--window",
+        type=int,
+        default=DEFAULT_WINDOW,
+        metavar="N",
+        help=f"Previous runs forming the rolling baseline (default: {DEFAULT_WINDOW}).",
+    )
+    return parser
+
+
+def check_main(argv: Sequence[str]) -> int:
+    from .history import RunHistory, format_check, parse_percentage
+
+    parser = build_check_parser()
+    args = parser.parse_args(argv)
+    try:
+        max_regression = parse_percentage(args.max_regression)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.window < 1:
+        parser.error("--window must be at least 1.")
+    slug_prefix = f"y{args.year}-" if args.year is not None else ""
+    checks = RunHistory().check(
+        slug_prefix=slug_prefix, max_regression=max_regression, window=args.window
+    )
+    print(format_check(checks, max_regression))
+    return 1 if any(check.regressed for check in checks) else 0
+
+
+COMMANDS: dict[str, Callable[[Sequence[str]], int]] = {
+    "bench": bench_main,
+    "check": check_main,
+    "history": history_main,
+    "list": list_main,
+    "serve": serve_main,
+}
+
+
 def main(argv: Sequence[str] | None = None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv and argv[0] in COMMANDS:
+        return COMMANDS[argv[0]](argv[1:])
+
+    from .base import ParsedInputCache
+    from .cache import ResultCache
+    from .isolation import IsolationLimits
+    from .runner import format_results, load_challenge, run_challenge
+
     parser = build_parser()
     args = parser.parse_args(argv)
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1.")
+    if args.timeout is not None and args.timeout <= 0:
+        parser.error("--timeout must be positive.")
+    if args.max_memory is not None and args.max_memory < 1:
+        parser.error("--max-memory must be at least 1.")
+    parse_cache = ParsedInputCache() if args.parse_cache else None
+    result_cache = None if args.no_cache else ResultCache()
+
+    if args.profile_output is not None and not args.profile:
+        parser.error("--profile-output requires --profile.")
+
+    isolation = None
+    if args.isolate or args.timeout is not None or args.max_memory is not None:
+        isolation = IsolationLimits(timeout=args.timeout, max_memory_mb=args.max_memory)
+
+    if args.concurrent and (isolation is not None or args.watch or args.input_glob or args.day == "all"):
+        parser.error("--concurrent applies to a single day run without --isolate, --watch or --input-glob.")
+
+    if args.watch:
+        return _watch(parser, args)
+
+    if args.input_glob is not None:
+        return _batch(parser, args, parse_cache, result_cache, isolation)
+
+    if args.day == "all":
+        from .parallel import format_year_results, run_year
+
+        if args.input is not None:
+            parser.error("--input cannot be combined with 'all'.")
+        if args.profile:
+            parser.error("--profile runs a single day; pick a day instead of 'all'.")
+        day_results, total_ms = run_year(
+            args.year,
+            part=args.part,
+            jobs=args.jobs,
+            parse_cache=parse_cache,
+            result_cache=result_cache,
+            refresh=args.refresh,
+            track_memory=args.memory,
+            isolation=isolation,
+            gc_mode=args.gc_mode,
+        )
+        print(format_year_results(args.year, day_results, total_ms))
+        if not args.no_history:
+            for day_result in day_results:
+                if day_result.input_digest is not None:
+                    _record_history(
+                        f"y{args.year}-day{day_result.day:02d}",
+                        day_result.input_digest,
+                        day_result.results,
+                        mode=_history_mode(args, isolation),
+                    )
+        failed = any(
+            day_result.error or any(result.status != "ok" for result in day_result.results)
+            for day_result in day_results
+        )
+        return 1 if failed else 0
 
     challenge = load_challenge(args.year, args.day, input_path=args.input)
-    results = run_challenge(challenge, part=args.part)
+    results = run_challenge(
+        challenge,
+        part=args.part,
+        parse_cache=parse_cache,
+        result_cache=result_cache,
+        refresh=args.refresh,
+        profile=args.profile,
+        track_memory=args.memory,
+        isolation=isolation,
+        concurrent=args.concurrent,
+        gc_mode=args.gc_mode,
+    )
     print(format_results(results))
+    if not args.no_history:
+        _record_history(
+            challenge.identity.slug,
+            challenge.input_digest(),
+            results,
+            mode=_history_mode(args, isolation),
+        )
+    if args.profile:
+        _report_profiles(results, top=args.profile_top, output=args.profile_output)
+    return 1 if any(result.status != "ok" for result in results) else 0
+
+
+def _history_mode(args: argparse.Namespace, isolation: IsolationLimits | None) -> str:
+    """Tag runs so that ``aoc check`` only compares timings measured the same way."""
+
+    if args.profile:
+        mode = "profile"
+    elif args.memory:
+        mode = "memory"
+    elif isolation is not None:
+        mode = "isolated"
+    elif args.concurrent:
+        mode = "concurrent"
+    else:
+        mode = "suite" if args.day == "all" else "plain"
+    # An explicit --gc changes what is measured; the day's own default does not.
+    return f"{mode}+gc-{args.gc_mode}" if args.gc_mode else mode
+
+
+def _record_history(slug: str, input_hash: str, results: Sequence[PartResult], *, mode: str) -> None:
+    import sqlite3
+
+    from .history import RunHistory
+
+    try:
+        RunHistory().record(slug, input_hash, results, mode=mode)
+    except (OSError, sqlite3.Error) as exc:
+        print(f"warning: could not record run history: {exc}", file=sys.stderr)
+
+
+def _batch(
+    parser: argparse.ArgumentParser,
+    args: argparse.Namespace,
+    parse_cache: ParsedInputCache | None,
+    result_cache: ResultCache | None,
+    isolation: IsolationLimits | None,
+) -> int:
+    import json
+
+    from .batch import expand_input_glob, run_batch
+
+    if args.day == "all":
+        parser.error("--input-glob runs a single day; pick a day instead of 'all'.")
+    if args.input is not None:
+        parser.error("--input and --input-glob are mutually exclusive.")
+    if args.profile:
+        parser.error("--profile cannot be combined with --input-glob.")
+    inputs = expand_input_glob(args.input_glob)
+    if not inputs:
+        parser.error(f"--input-glob {args.input_glob!r} matched no files.")
+
+    failed = 0
+    for input_result in run_batch(
+        args.year,
+        args.day,
+        inputs,
+        part=args.part,
+        jobs=args.jobs,
+        parse_cache=parse_cache,
+        result_cache=result_cache,
+        refresh=args.refresh,
+        track_memory=args.memory,
+        isolation=isolation,
+        gc_mode=args.gc_mode,
+    ):
+        failed += not input_result.ok
+        print(json.dumps(input_result.to_dict()), flush=True)
+    print(f"{len(inputs)} inputs, {failed} failed", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def _watch(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    from .base import STDIN_PATH, ParsedInputCache
+    from .watch import watch
+
+    if args.day == "all":
+        parser.error("--watch follows a single day; pick a day instead of 'all'.")
+    if args.input == STDIN_PATH:
+        parser.error("--watch needs an input file it can watch, not stdin.")
+    if args.profile or args.memory or args.isolate or args.timeout or args.max_memory:
+        parser.error("--watch cannot be combined with --profile, --memory or isolation options.")
+    if args.no_cache or args.refresh:
+        parser.error("--watch always recomputes and never stores answers; drop --no-cache/--refresh.")
+    parse_cache = ParsedInputCache() if args.parse_cache else None
+    watch(
+        args.year,
+        args.day,
+        part=args.part,
+        input_path=args.input,
+        parse_cache=parse_cache,
+        gc_mode=args.gc_mode,
+    )
     return 0
 
 
+def _report_profiles(results: Sequence[PartResult], *, top: int, output: Path | None) -> None:
+    from .profiling import format_profile, write_collapsed
+
+    profiled = [(f"part{result.part}", result.profile) for result in results if result.profile]
+    for label, stats in profiled:
+        print(f"\n----- Profile {label} (top {top} by cumulative time) -----")
+        print(format_profile(stats, top=top))
+    if output is not None:
+        write_collapsed(profiled, output)
+        print(f"\nCollapsed stacks written to {output}")
+
+
 if __name__ == "__main__":  # pragma: no cover
     sys.exit(main())
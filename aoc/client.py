@@ -0,0 +1,94 @@
+"""Thin client for ``aoc serve``: forwards one run request and prints the reply.
+
+Deliberately avoids argparse and the runner so that startup cost is little more
+than the interpreter itself::
+
+    python -m aoc.client 2025 8 [--part 1|2|both] [--input PATH|-] [--socket PATH]
+    python -m aoc.client --shutdown
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+from . import CACHE_DIR
+
+DEFAULT_SOCKET = Path(os.environ.get("AOC_SOCKET", CACHE_DIR / "aoc.sock"))
+
+_USAGE = (
+    "usage: python -m aoc.client YEAR DAY [--part 1|2|both] [--input PATH|-] [--socket PATH]\n"
+    "       python -m aoc.client --shutdown [--socket PATH]"
+)
+
+
+def request(payload: dict, *, socket_path: Path = DEFAULT_SOCKET) -> dict:
+    """Send ``payload`` to the daemon and return its decoded JSON reply."""
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(str(socket_path))
+        conn.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+        with conn.makefile("rb") as reply:
+            return json.loads(reply.readline())
+
+
+def _parse_args(argv: Sequence[str]) -> tuple[dict, Path]:
+    options = {"--part": "both", "--input": None, "--socket": str(DEFAULT_SOCKET)}
+    positionals: list[str] = []
+    shutdown = False
+    args = iter(argv)
+    for arg in args:
+        if arg == "--shutdown":
+            shutdown = True
+        elif arg in options:
+            value = next(args, None)
+            if value is None:
+                raise ValueError(f"{arg} expects a value")
+            options[arg] = value
+        elif arg.startswith("-") and arg != "-":
+            raise ValueError(f"unknown option {arg}")
+        else:
+            positionals.append(arg)
+
+    socket_path = Path(options["--socket"])
+    if shutdown:
+        return {"command": "shutdown"}, socket_path
+    if len(positionals) != 2:
+        raise ValueError("expected YEAR and DAY")
+    if options["--part"] not in ("1", "2", "both"):
+        raise ValueError("--part must be 1, 2 or both")
+
+    payload: dict = {"year": int(positionals[0]), "day": int(positionals[1]), "part": options["--part"]}
+    if options["--input"] == "-":
+        payload["input_text"] = sys.stdin.read()
+    elif options["--input"] is not None:
+        payload["input"] = str(Path(options["--input"]).resolve())
+    return payload, socket_path
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    try:
+        payload, socket_path = _parse_args(sys.argv[1:] if argv is None else argv)
+    except ValueError as exc:
+        print(f"{_USAGE}\nerror: {exc}", file=sys.stderr)
+        return 2
+
+    try:
+        reply = request(payload, socket_path=socket_path)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"No aoc server listening on {socket_path}; start one with 'aoc serve'.", file=sys.stderr)
+        return 2
+
+    if "text" in reply:
+        print(reply["text"])
+    if reply.get("error"):
+        print(reply["error"], file=sys.stderr)
+    return 0 if reply.get("ok") else 1
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,88 @@
+"""Registry of seeded synthetic input generators used for scaling benchmarks."""
+
+from __future__ import annotations
+
+import importlib
+import math
+import random
+from collections.abc import Callable, Iterator, Sequence
+from pathlib import Path
+
+#: ``generator(n, rng)`` yields the text of an input of size ``n`` in pieces.
+Generator = Callable[[int, random.Random], Iterator[str]]
+
+_REGISTRY: dict[tuple[int, int], Generator] = {}
+
+
+def register(year: int, day: int) -> Callable[[Generator], Generator]:
+    """Decorator registering ``generator`` as the synthetic input source for a day."""
+
+    def decorator(generator: Generator) -> Generator:
+        _REGISTRY[(year, day)] = generator
+        return generator
+
+    return decorator
+
+
+def get_generator(year: int, day: int) -> Generator:
+    """Return the generator for ``(year, day)``, importing the year's generator module."""
+
+    try:
+        importlib.import_module(f"aoc.years.y{year}.generators")
+    except ModuleNotFoundError as exc:
+        if exc.name != f"aoc.years.y{year}.generators":
+            raise
+    try:
+        return _REGISTRY[(year, day)]
+    except KeyError:
+        raise LookupError(
+            f"No input generator registered for {year} day {day}. "
+            f"Add one to aoc/years/y{year}/generators.py with @register({year}, {day})."
+        ) from None
+
+
+def write_input(year: int, day: int, n: int, path: Path, *, seed: int = 0) -> Path:
+    """Generate an input of size ``n`` into ``path``; the same seed yields the same file."""
+
+    generator = get_generator(year, day)
+    rng = random.Random(f"{year}-{day}-{n}-{seed}")
+    with path.open("w", encoding="utf-8") as handle:
+        for piece in generator(n, rng):
+            handle.write(piece)
+    return path
+
+
+def parse_scales(text: str) -> list[int]:
+    """Parse ``"1e3,1e4,1e5"`` into ``[1000, 10000, 100000]``."""
+
+    scales: list[int] = []
+    for item in text.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        try:
+            value = float(item)
+        except ValueError:
+            raise ValueError(f"Scale {item!r} is not a number.") from None
+        if not math.isfinite(value) or value < 1 or value != int(value):
+            raise ValueError(f"Scale {item!r} must be a finite positive integer.")
+        scales.append(int(value))
+    if not scales:
+        raise ValueError("At least one scale is required.")
+    return sorted(set(scales))
+
+
+def fit_growth_exponent(sizes: Sequence[int], times_ms: Sequence[float]) -> float | None:
+    """Least-squares slope of ``log(time)`` against ``log(n)``: ~1 is linear, ~2 quadratic."""
+
+    if len(sizes) < 2:
+        return None
+    xs = [math.log(size) for size in sizes]
+    # Clamp so near-zero timings (unimplemented parts) do not explode the logarithm.
+    ys = [math.log(max(time_ms, 1e-3)) for time_ms in times_ms]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if spread == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
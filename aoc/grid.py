@@ -0,0 +1,375 @@
+"""Compact character grids with whole-grid mask and neighbour-count operations.
+
+A :class:`Grid` keeps the puzzle bytes exactly as they sit in the input file: one
+``bytearray``, row-major, each row followed by its ``\\n``. That newline doubles as a
+padding column, so shifting a row sideways never wraps into the next row.
+
+Masks select cells. With NumPy installed they are ``bool`` arrays shaped
+``(height, stride)``; otherwise they are Python ints with bit ``row * stride + col``
+set per selected cell, where a shift by one bit moves a whole mask one column and a
+shift by ``stride`` bits moves it one row. Both kinds support ``&``, ``|``, ``^`` and
+``a & ~b``, so solutions combine them with plain operators and leave everything
+else (counting, comparing, listing) to :class:`Grid` methods.
+"""
+
+from __future__ import annotations
+
+import mmap
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from ._compat import numpy
+from .base import RawInput
+
+_NEWLINE = 0x0A
+#: :meth:`Grid.peel` recounts the whole grid instead of decrementing neighbours
+#: when a round removes more than ``1 / _DENSE_ROUND_FRACTION`` of all cells.
+_DENSE_ROUND_FRACTION = 64
+
+
+def _bit_table(chars: bytes) -> bytes:
+    """Translation table sending ``chars`` to ``"1"`` and every other byte to ``"0"``."""
+
+    return bytes(0x31 if byte in chars else 0x30 for byte in range(256))
+
+
+def _add_planes(left: list[int], right: list[int]) -> list[int]:
+    """Ripple-carry add two bit-sliced numbers (plane ``i`` holds bit ``i`` of every lane)."""
+
+    planes: list[int] = []
+    carry = 0
+    for index in range(max(len(left), len(right))):
+        a = left[index] if index < len(left) else 0
+        b = right[index] if index < len(right) else 0
+        partial = a ^ b
+        planes.append(partial ^ carry)
+        carry = (a & b) | (carry & partial)
+    if carry:
+        planes.append(carry)
+    return planes
+
+
+class Grid:
+    """A rectangular grid of single-byte cells; see the module docstring for masks."""
+
+    def __init__(self, cells: bytearray, width: int, height: int, *, use_numpy: bool | None = None):
+        self.cells = cells
+        self.width = width
+        self.height = height
+        self.stride = width + 1
+        if use_numpy and numpy is None:
+            raise ModuleNotFoundError("NumPy is not installed; construct the grid with use_numpy=False.")
+        self.use_numpy = numpy is not None if use_numpy is None else use_numpy
+        self._valid: Any = None
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pickle just the bytes; the backend is picked again where the grid is loaded.
+        return (type(self), (self.cells, self.width, self.height))
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray | mmap.mmap, *, use_numpy: bool | None = None) -> Grid:
+        """Build a grid from newline-separated rows (``\\r\\n`` and a missing final newline are fine)."""
+
+        cells = bytearray(data)
+        if cells.find(b"\r") != -1:
+            cells = cells.replace(b"\r\n", b"\n")
+        while cells.endswith(b"\n\n"):
+            cells.pop()
+        if cells and not cells.endswith(b"\n"):
+            cells.append(_NEWLINE)
+        width = cells.find(b"\n") if cells else 0
+        stride = width + 1
+        height = len(cells) // stride if cells else 0
+        if len(cells) != height * stride or cells[width::stride].count(_NEWLINE) != height:
+            raise ValueError("Grid rows must all have the same width.")
+        return cls(cells, width, height, use_numpy=use_numpy)
+
+    @classmethod
+    def from_raw(cls, data: RawInput, *, use_numpy: bool | None = None) -> Grid:
+        return cls.from_bytes(data.data, use_numpy=use_numpy)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], *, use_numpy: bool | None = None) -> Grid:
+        return cls.from_bytes("".join(f"{line}\n" for line in lines).encode(), use_numpy=use_numpy)
+
+    # ------------------------------------------------------------------
+    # Cells and rows
+    # ------------------------------------------------------------------
+    def index(self, row: int, col: int) -> int:
+        """Flat cell index (the mask bit / array offset) of ``(row, col)``."""
+
+        return row * self.stride + col
+
+    def position(self, index: int) -> tuple[int, int]:
+        return divmod(index, self.stride)
+
+    def __getitem__(self, position: tuple[int, int]) -> str:
+        row, col = position
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            raise IndexError(f"{position} is outside the {self.height}x{self.width} grid")
+        return chr(self.cells[row * self.stride + col])
+
+    def row(self, row: int) -> memoryview:
+        start = row * self.stride
+        return memoryview(self.cells)[start : start + self.width]
+
+    def rows(self) -> Iterator[memoryview]:
+        view, width = memoryview(self.cells), self.width
+        for start in range(0, len(self.cells), self.stride):
+            yield view[start : start + width]
+
+    def find(self, char: bytes) -> tuple[int, int] | None:
+        """Position of the first ``char`` cell in reading order."""
+
+        index = self.cells.find(char)
+        return None if index == -1 else self.position(index)
+
+    def row_masks(self, chars: bytes, *, start: int = 0) -> Iterator[int]:
+        """Yield, per row from ``start``, an int with bit ``col`` set for each ``chars`` cell.
+
+        Row scans (beams, falling sand, sweeps) keep their state as one int of
+        ``width`` bits and update it with shifts and masks instead of per-cell loops.
+        """
+
+        table = _bit_table(chars)
+        for line in self.rows() if start == 0 else (self.row(r) for r in range(start, self.height)):
+            yield int(line.tobytes().translate(table)[::-1] or b"0", 2)
+
+    # ------------------------------------------------------------------
+    # Whole-grid masks
+    # ------------------------------------------------------------------
+    def mask(self, chars: bytes) -> Any:
+        """Mask of every cell holding one of ``chars``."""
+
+        if self.use_numpy:
+            array = numpy.frombuffer(self.cells, dtype=numpy.uint8).reshape(self.height, self.stride)
+            if len(chars) == 1:
+                return array == chars[0]
+            selected = numpy.zeros(256, dtype=bool)
+            selected[list(chars)] = True
+            return selected[array]
+        if not self.cells:
+            return 0
+        return int(self.cells.translate(_bit_table(chars))[::-1], 2)
+
+    @property
+    def valid(self) -> Any:
+        """Mask of all real cells (everything but the newline padding column)."""
+
+        if self._valid is None:
+            if self.use_numpy:
+                self._valid = numpy.ones((self.height, self.stride), dtype=bool)
+                self._valid[:, -1] = False
+            else:
+                # Repeat the one-row pattern by doubling instead of scanning every cell.
+                valid, rows = (1 << self.width) - 1, 1
+                while rows < self.height:
+                    step = min(rows, self.height - rows)
+                    valid |= (valid & ((1 << (step * self.stride)) - 1)) << (rows * self.stride)
+                    rows += step
+                self._valid = valid if self.height else 0
+        return self._valid
+
+    def invert(self, mask: Any) -> Any:
+        return self.valid & ~mask
+
+    def count(self, mask: Any) -> int:
+        return int(numpy.count_nonzero(mask)) if self.use_numpy else mask.bit_count()
+
+    def indices(self, mask: Any) -> list[int]:
+        """Flat indices of every selected cell in reading order."""
+
+        if self.use_numpy:
+            return numpy.flatnonzero(mask).tolist()
+        bits = bin(mask)[:1:-1]
+        found: list[int] = []
+        index = bits.find("1")
+        while index != -1:
+            found.append(index)
+            index = bits.find("1", index + 1)
+        return found
+
+    def positions(self, mask: Any) -> Iterator[tuple[int, int]]:
+        """Yield ``(row, col)`` of every selected cell in reading order."""
+
+        stride = self.stride
+        for index in self.indices(mask):
+            yield divmod(index, stride)
+
+    def shift(self, mask: Any, d_row: int, d_col: int) -> Any:
+        """Move every selected cell by ``(d_row, d_col)``; cells leaving the grid are dropped."""
+
+        if self.use_numpy:
+            shifted = numpy.zeros_like(mask)
+            rows, cols = mask.shape
+            shifted[max(d_row, 0) : rows + min(d_row, 0), max(d_col, 0) : cols + min(d_col, 0)] = mask[
+                max(-d_row, 0) : rows + min(-d_row, 0), max(-d_col, 0) : cols + min(-d_col, 0)
+            ]
+            return shifted & self.valid
+        offset = d_row * self.stride + d_col
+        shifted = mask << offset if offset >= 0 else mask >> -offset
+        return shifted & self.valid
+
+    # ------------------------------------------------------------------
+    # Neighbour counts
+    # ------------------------------------------------------------------
+    def neighbor_counts(self, mask: Any, *, diagonal: bool = True) -> Any:
+        """Count, for every cell, how many of its 8 (or 4) neighbours are in ``mask``.
+
+        The result is opaque (a ``uint8`` array, or bit-sliced int planes without
+        NumPy); query it with :meth:`at_least`, :meth:`fewer_than` or :meth:`count_values`.
+        Values are only meaningful on real cells.
+        """
+
+        if self.use_numpy:
+            # Work on the flat array: the padding column already keeps rows apart, so a
+            # one-row zero border at each end is all that the shifted slices need.
+            size, stride = mask.size, self.stride
+            padded = numpy.zeros(size + 2 * stride + 2, dtype=numpy.uint8)
+            padded[stride + 1 : stride + 1 + size] = mask.reshape(-1).view(numpy.uint8)
+            counts = padded[stride : stride + size] + padded[stride + 2 : stride + 2 + size]
+            if diagonal:
+                # Left + centre + right per cell, summed once for the rows above and below.
+                triple = padded[:-2] + padded[1:-1]
+                triple += padded[2:]
+                counts += triple[:size]
+                counts += triple[2 * stride : 2 * stride + size]
+            else:
+                counts += padded[1 : 1 + size]
+                counts += padded[2 * stride + 1 : 2 * stride + 1 + size]
+            counts = counts.reshape(mask.shape)
+            counts[:, -1] = 0
+            return counts
+
+        stride = self.stride
+        left, right = mask << 1, mask >> 1
+        sides = left ^ right
+        # Left + right neighbours as a 2-bit number per cell.
+        pair = [sides, left & right]
+        if diagonal:
+            # Left + centre + right, summed once and reused for the rows above and below.
+            triple = [sides ^ mask, (left & right) | (mask & sides)]
+        else:
+            triple = [mask]
+        above = [plane << stride for plane in triple]
+        below = [plane >> stride for plane in triple]
+        return _add_planes(_add_planes(above, below), pair)
+
+    def at_least(self, counts: Any, threshold: int) -> Any:
+        """Mask of real cells whose count is ``>= threshold``."""
+
+        if threshold <= 0:
+            return self.valid
+        if self.use_numpy:
+            return counts >= threshold  # padding cells were zeroed by neighbor_counts
+        # Bit-sliced comparison from the most significant plane down.
+        if threshold >= 1 << len(counts):
+            return 0
+        greater, equal = 0, self.valid
+        for bit in range(len(counts) - 1, -1, -1):
+            plane = counts[bit]
+            if threshold >> bit & 1:
+                equal &= plane
+            else:
+                greater |= equal & plane
+                equal &= ~plane
+        return (greater | equal) & self.valid
+
+    def fewer_than(self, counts: Any, threshold: int) -> Any:
+        """Mask of real cells whose count is ``< threshold``."""
+
+        return self.invert(self.at_least(counts, threshold))
+
+    def count_values(self, counts: Any) -> list[int]:
+        """Every real cell's count in flat index order (padding cells read as 0)."""
+
+        if self.use_numpy:
+            return counts.ravel().tolist()
+        values = [0] * (self.height * self.stride)
+        for bit, plane in enumerate(counts):
+            weight = 1 << bit
+            bits = bin(plane & self.valid)[:1:-1]
+            index = bits.find("1")
+            while index != -1:
+                values[index] += weight
+                index = bits.find("1", index + 1)
+        return values
+
+    def _neighbor_offsets(self, diagonal: bool) -> tuple[int, ...]:
+        stride = self.stride
+        if diagonal:
+            return (-stride - 1, -stride, -stride + 1, -1, 1, stride - 1, stride, stride + 1)
+        return (-stride, -1, 1, stride)
+
+    def peel(self, mask: Any, threshold: int, *, diagonal: bool = True) -> list[int]:
+        """Repeatedly remove every ``mask`` cell with fewer than ``threshold`` neighbours
+        left in the mask, until none remains; return how many cells each round removed.
+
+        Counts are computed once with :meth:`neighbor_counts`. After that, each round
+        visits only the neighbours of the cells it removes and queues those that just
+        dropped below ``threshold``, so the whole peel is linear in the number of cells.
+        With NumPy, a round that removes a large share of the grid recounts it whole
+        instead, which is cheaper there and still linear overall.
+        """
+
+        if threshold <= 0:
+            return []
+        counts = self.neighbor_counts(mask, diagonal=diagonal)
+        offsets = self._neighbor_offsets(diagonal)
+        size = self.height * self.stride
+        rounds: list[int] = []
+        if self.use_numpy:
+            # One padding row above and below keeps every neighbour index in range.
+            pad = self.stride + 1
+            present = numpy.zeros(size + 2 * pad, dtype=bool)
+            present[pad : pad + size] = mask.reshape(-1)
+            live = present[pad : pad + size].reshape(self.height, self.stride)
+            remaining = numpy.zeros(size + 2 * pad, dtype=numpy.int8)
+            remaining[pad : pad + size] = counts.reshape(-1)
+            frontier = numpy.flatnonzero(present & (remaining < threshold))
+            while len(frontier):
+                rounds.append(len(frontier))
+                present[frontier] = False
+                if len(frontier) * _DENSE_ROUND_FRACTION > size:
+                    # Removing a large share of the grid: one more whole-grid count is
+                    # cheaper than millions of scattered decrements.
+                    remaining[pad : pad + size] = self.neighbor_counts(live, diagonal=diagonal).reshape(-1)
+                    frontier = numpy.flatnonzero(present & (remaining < threshold))
+                    continue
+                queued = []
+                # Frontier cells are distinct, so one offset never hits a cell twice and
+                # plain fancy-index arithmetic applies every decrement.
+                for offset in offsets:
+                    touched = frontier + offset
+                    touched = touched[present[touched]]
+                    remaining[touched] -= 1
+                    # Counts drop one at a time, so each cell crosses the threshold once.
+                    queued.append(touched[remaining[touched] == threshold - 1])
+                frontier = numpy.concatenate(queued)
+                frontier.sort()  # neighbouring indices next to each other: cache-friendly
+            return rounds
+
+        remaining = self.count_values(counts)
+        present = bytearray(size)
+        members = self.indices(mask)
+        for index in members:
+            present[index] = 1
+        frontier = [index for index in members if remaining[index] < threshold]
+        while frontier:
+            rounds.append(len(frontier))
+            for index in frontier:
+                present[index] = 0
+            queued: list[int] = []
+            for index in frontier:
+                for offset in offsets:
+                    neighbour = index + offset
+                    if 0 <= neighbour < size and present[neighbour]:
+                        remaining[neighbour] -= 1
+                        # Counts drop one at a time, so this fires once per cell.
+                        if remaining[neighbour] == threshold - 1:
+                            queued.append(neighbour)
+            frontier = queued
+        return rounds
@@ -0,0 +1,282 @@
+"""Local SQLite log of every freshly timed part, with trend reports and a regression gate."""
+
+from __future__ import annotations
+
+import platform
+import sqlite3
+import statistics
+import subprocess
+from collections.abc import Iterable, Sequence
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from . import CACHE_DIR, PROJECT_ROOT
+
+if TYPE_CHECKING:
+    from .runner import PartResult
+
+#: Previous runs (same mode and input) whose median forms the baseline in ``aoc check``.
+DEFAULT_WINDOW = 5
+#: Slowdowns smaller than this are timer noise, whatever their relative size.
+MIN_REGRESSION_MS = 1.0
+
+_SPARKS = "▁▂▃▄▅▆▇█"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    recorded_at TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    part TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    status TEXT NOT NULL,
+    duration_ms REAL NOT NULL,
+    parse_ms REAL NOT NULL,
+    peak_memory_kb REAL,
+    mode TEXT NOT NULL,
+    git_commit TEXT,
+    python_version TEXT NOT NULL,
+    input_hash TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_slug ON runs (slug, part, id);
+"""
+
+
+@dataclass(slots=True, frozen=True)
+class RunRecord:
+    id: int
+    recorded_at: str
+    slug: str
+    part: str
+    answer: str
+    status: str
+    duration_ms: float
+    parse_ms: float
+    peak_memory_kb: float | None
+    mode: str
+    git_commit: str | None
+    python_version: str
+    input_hash: str
+
+
+@dataclass(slots=True, frozen=True)
+class RegressionCheck:
+    slug: str
+    part: str
+    mode: str
+    latest: RunRecord
+    baseline_ms: float | None
+    samples: int
+    regressed: bool
+
+    @property
+    def change(self) -> float | None:
+        if not self.baseline_ms:
+            return None
+        return self.latest.duration_ms / self.baseline_ms - 1
+
+
+@lru_cache(maxsize=1)
+def git_commit() -> str | None:
+    """Short hash of the checked-out commit, or ``None`` outside a git work tree."""
+
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short=12", "HEAD"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if completed.returncode != 0:
+        return None
+    return completed.stdout.strip() or None
+
+
+def parse_percentage(text: str) -> float:
+    """Parse ``"15%"`` (or ``"15"``) into ``0.15``."""
+
+    value = float(text.strip().removesuffix("%"))
+    if value < 0:
+        raise ValueError(f"Percentage {text!r} must not be negative.")
+    return value / 100
+
+
+class RunHistory:
+    """Append-only table of runs stored in ``<CACHE_DIR>/history.sqlite3``.
+
+    Only fresh timings are recorded: cached answers would replay an old duration.
+    ``mode`` tags how a run was measured (``"plain"``, ``"suite"``, ``"memory"``...)
+    so that baselines never mix instrumented or contended timings with clean ones.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or CACHE_DIR / "history.sqlite3"
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def record(
+        self, slug: str, input_hash: str, results: Iterable[PartResult], *, mode: str = "plain"
+    ) -> int:
+        """Store every non-cached result and return how many rows were written."""
+
+        recorded_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        rows = [
+            (
+                recorded_at,
+                slug,
+                result.part,
+                str(result.answer),
+                result.status,
+                result.duration_ms,
+                result.parse_ms,
+                result.peak_memory_kb,
+                mode,
+                git_commit(),
+                platform.python_version(),
+                input_hash,
+            )
+            for result in results
+            if not result.cached
+        ]
+        if not rows:
+            return 0
+        with closing(self._connect()) as connection, connection:
+            connection.executemany(
+                "INSERT INTO runs (recorded_at, slug, part, answer, status, duration_ms, parse_ms, "
+                "peak_memory_kb, mode, git_commit, python_version, input_hash) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def runs(
+        self, *, slug_prefix: str = "", part: str | None = None, limit: int | None = None
+    ) -> list[RunRecord]:
+        """Return matching runs oldest first; ``limit`` keeps only the most recent ones."""
+
+        if not self.path.exists():
+            return []
+        query = "SELECT * FROM runs WHERE slug LIKE ?"
+        params: list[object] = [slug_prefix + "%"]
+        if part is not None:
+            query += " AND part = ?"
+            params.append(part)
+        query += " ORDER BY id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with closing(self._connect()) as connection:
+            rows = connection.execute(query, params).fetchall()
+        return [RunRecord(*row) for row in reversed(rows)]
+
+    def check(
+        self,
+        *,
+        slug_prefix: str = "",
+        max_regression: float,
+        window: int = DEFAULT_WINDOW,
+    ) -> list[RegressionCheck]:
+        """Compare each part's latest successful run with the median of the ones before it."""
+
+        groups: dict[tuple[str, str, str], list[RunRecord]] = {}
+        for run in self.runs(slug_prefix=slug_prefix):
+            if run.status == "ok":
+                groups.setdefault((run.slug, run.part, run.mode), []).append(run)
+
+        checks: list[RegressionCheck] = []
+        for (slug, part, mode), runs in sorted(groups.items()):
+            latest = runs[-1]
+            previous = [run.duration_ms for run in runs[:-1] if run.input_hash == latest.input_hash]
+            previous = previous[-window:]
+            baseline = statistics.median(previous) if previous else None
+            regressed = (
+                baseline is not None
+                and latest.duration_ms > baseline * (1 + max_regression)
+                and latest.duration_ms - baseline >= MIN_REGRESSION_MS
+            )
+            checks.append(
+                RegressionCheck(
+                    slug=slug,
+                    part=part,
+                    mode=mode,
+                    latest=latest,
+                    baseline_ms=baseline,
+                    samples=len(previous),
+                    regressed=regressed,
+                )
+            )
+        return checks
+
+
+def sparkline(values: Sequence[float]) -> str:
+    if not values:
+        return ""
+    low, high = min(values), max(values)
+    if high == low:
+        return _SPARKS[0] * len(values)
+    scale = (len(_SPARKS) - 1) / (high - low)
+    return "".join(_SPARKS[round((value - low) * scale)] for value in values)
+
+
+def format_history(slug: str, runs: Sequence[RunRecord]) -> str:
+    """Return one row per run plus a per-part trend line."""
+
+    lines = [f"===== Advent of Code History: {slug} ====="]
+    if not runs:
+        lines.append("No recorded runs.")
+        return "\n".join(lines)
+    lines.append(
+        f"{'Recorded (UTC)':<25} {'Commit':<12} {'Python':<8} {'Mode':<10} "
+        f"{'Part':>4} {'Duration':>12} {'Peak':>10}  Input"
+    )
+    for run in runs:
+        peak = f"{run.peak_memory_kb / 1024:.1f} MiB" if run.peak_memory_kb is not None else "-"
+        duration = f"{run.duration_ms:.2f} ms" if run.status == "ok" else f"[{run.status}]"
+        lines.append(
+            f"{run.recorded_at:<25} {run.git_commit or '-':<12} {run.python_version:<8} "
+            f"{run.mode:<10} {run.part:>4} {duration:>12} {peak:>10}  {run.input_hash[:8]}"
+        )
+
+    for part in sorted({run.part for run in runs}):
+        timings = [run.duration_ms for run in runs if run.part == part and run.status == "ok"]
+        if not timings:
+            continue
+        lines.append(
+            f"Part {part} trend: {sparkline(timings)}  "
+            f"(min {min(timings):.2f} ms, median {statistics.median(timings):.2f} ms, "
+            f"last {timings[-1]:.2f} ms)"
+        )
+    return "\n".join(lines)
+
+
+def format_check(checks: Sequence[RegressionCheck], max_regression: float) -> str:
+    """Return the ``aoc check`` table; regressed rows are flagged ``REGRESSED``."""
+
+    lines = [f"===== Advent of Code Check (max regression {max_regression:.0%}) ====="]
+    if not checks:
+        lines.append("No recorded runs.")
+        return "\n".join(lines)
+    for check in checks:
+        label = f"{check.slug} part {check.part} [{check.mode}]"
+        if check.baseline_ms is None:
+            lines.append(f"{label:<34} {check.latest.duration_ms:>10.2f} ms  no baseline yet")
+            continue
+        verdict = "REGRESSED" if check.regressed else "ok"
+        lines.append(
+            f"{label:<34} {check.latest.duration_ms:>10.2f} ms  "
+            f"baseline {check.baseline_ms:>10.2f} ms ({check.change:+.1%}, n={check.samples})  {verdict}"
+        )
+    regressed = sum(check.regressed for check in checks)
+    lines.append(f"{regressed} regression(s) across {len(checks)} part(s).")
+    return "\n".join(lines)
@@ -0,0 +1,215 @@
+"""Import-free index of solution modules, built by scanning their source with ``ast``.
+
+Listing days must not import them: each solution pulls in its own dependencies and
+may do work at import time. The index records, per ``dayNN.py``, the challenge
+class the runner would pick and whether each part has a real implementation.
+Entries are cached in ``<CACHE_DIR>/index.json`` and rescanned when a file's
+mtime or size changes.
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from . import CACHE_DIR, PROJECT_ROOT, YEARS_DIR, atomic_write
+
+DAY_MODULE_PATTERN = re.compile(r"^day(\d{2})\.py$")
+
+_INDEX_VERSION = 1
+
+
+@dataclass(slots=True, frozen=True)
+class SolutionEntry:
+    year: int
+    day: int
+    path: str
+    class_name: str | None
+    part1: bool
+    part2: bool
+    mtime_ns: int
+    size: int
+
+    @property
+    def input_path(self) -> Path:
+        return YEARS_DIR / f"y{self.year}" / "inputs" / f"day{self.day:02d}.txt"
+
+
+def _is_challenge_base(node: ast.expr) -> bool:
+    name = node.attr if isinstance(node, ast.Attribute) else getattr(node, "id", None)
+    return name == "BaseChallenge"
+
+
+def _is_stub(function: ast.FunctionDef) -> bool:
+    """True for empty bodies, ``raise NotImplementedError`` and ``return "not implemented"``."""
+
+    body = [
+        statement
+        for statement in function.body
+        if not isinstance(statement, ast.Pass)
+        and not (isinstance(statement, ast.Expr) and isinstance(statement.value, ast.Constant))
+    ]
+    if not body:
+        return True
+    if len(body) != 1:
+        return False
+    [statement] = body
+    if isinstance(statement, ast.Raise) and statement.exc is not None:
+        exc = statement.exc.func if isinstance(statement.exc, ast.Call) else statement.exc
+        return getattr(exc, "id", None) == "NotImplementedError"
+    if isinstance(statement, ast.Return) and isinstance(statement.value, ast.Constant):
+        value = statement.value.value
+        return isinstance(value, str) and "not implemented" in value.lower()
+    return False
+
+
+def _challenge_class(tree: ast.Module) -> ast.ClassDef | None:
+    """Mirror ``runner._locate_challenge_class``: ``Challenge`` first, else the first subclass."""
+
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+    if "Challenge" in classes:
+        return classes["Challenge"]
+    for node in tree.body:
+        if (
+            isinstance(node, ast.Assign)
+            and any(getattr(target, "id", None) == "Challenge" for target in node.targets)
+            and isinstance(node.value, ast.Name)
+            and node.value.id in classes
+        ):
+            return classes[node.value.id]
+    for node in classes.values():
+        if any(_is_challenge_base(base) for base in node.bases):
+            return node
+    return None
+
+
+def scan_solution(path: Path, year: int, day: int) -> SolutionEntry:
+    """Build the index entry for one solution file without importing it."""
+
+    stat = path.stat()
+    class_name = None
+    implemented = {"solve_part1": False, "solve_part2": False}
+    try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+    except SyntaxError:
+        tree = None
+    node = _challenge_class(tree) if tree is not None else None
+    if node is not None:
+        class_name = node.name
+        for item in node.body:
+            if isinstance(item, ast.FunctionDef) and item.name in implemented:
+                implemented[item.name] = not _is_stub(item)
+    return SolutionEntry(
+        year=year,
+        day=day,
+        path=path.relative_to(PROJECT_ROOT).as_posix(),
+        class_name=class_name,
+        part1=implemented["solve_part1"],
+        part2=implemented["solve_part2"],
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+    )
+
+
+class SolutionIndex:
+    """Cached :class:`SolutionEntry` records, refreshed by ``stat`` on every lookup."""
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or CACHE_DIR / "index.json"
+        self._entries: dict[str, SolutionEntry] = self._load()
+
+    def _load(self) -> dict[str, SolutionEntry]:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+            if payload.get("version") != _INDEX_VERSION:
+                return {}
+            return {key: SolutionEntry(**value) for key, value in payload["entries"].items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def _save(self) -> None:
+        payload = {
+            "version": _INDEX_VERSION,
+            "entries": {key: asdict(entry) for key, entry in sorted(self._entries.items())},
+        }
+        atomic_write(self.path, json.dumps(payload, indent=1))
+
+    def entries(self, year: int | None = None) -> list[SolutionEntry]:
+        """Return entries sorted by year and day, rescanning files whose mtime or size moved."""
+
+        if year is None:
+            year_dirs = sorted(
+                path for path in YEARS_DIR.glob("y[0-9]*") if path.name[1:].isdigit()
+            )
+        else:
+            year_dirs = [YEARS_DIR / f"y{year}"]
+
+        found: list[SolutionEntry] = []
+        changed = False
+        for year_dir in year_dirs:
+            solutions_dir = year_dir / "solutions"
+            if not solutions_dir.is_dir():
+                continue
+            for path in sorted(solutions_dir.iterdir()):
+                match = DAY_MODULE_PATTERN.match(path.name)
+                if not match:
+                    continue
+                entry, rescanned = self._refresh(path, int(year_dir.name[1:]), int(match.group(1)))
+                changed |= rescanned
+                found.append(entry)
+
+        # Forget files that were deleted from the scanned years.
+        scanned = {year_dir.name for year_dir in year_dirs}
+        live = {entry.path for entry in found}
+        for key in [key for key in self._entries if key not in live]:
+            if Path(key).parent.parent.name in scanned:
+                del self._entries[key]
+                changed = True
+        if changed:
+            self._save_quietly()
+        return found
+
+    def get(self, year: int, day: int) -> SolutionEntry | None:
+        """Return the entry for one day, rescanning only that file; ``None`` if it is missing."""
+
+        path = YEARS_DIR / f"y{year}" / "solutions" / f"day{day:02d}.py"
+        if not path.is_file():
+            return None
+        entry, changed = self._refresh(path, year, day)
+        if changed:
+            self._save_quietly()
+        return entry
+
+    def _refresh(self, path: Path, year: int, day: int) -> tuple[SolutionEntry, bool]:
+        key = path.relative_to(PROJECT_ROOT).as_posix()
+        entry = self._entries.get(key)
+        stat = path.stat()
+        if entry is not None and (entry.mtime_ns, entry.size) == (stat.st_mtime_ns, stat.st_size):
+            return entry, False
+        entry = self._entries[key] = scan_solution(path, year, day)
+        return entry, True
+
+    def _save_quietly(self) -> None:
+        try:
+            self._save()
+        except OSError:
+            pass  # a read-only checkout still lists and runs correctly, just without caching
+
+
+def format_index(entries: list[SolutionEntry]) -> str:
+    """Render entries as the ``aoc list`` table."""
+
+    if not entries:
+        return "No solutions found."
+    width = max(len(entry.class_name or "?") for entry in entries)
+    lines = [f"{'Year':<5} {'Day':>3}  {'Class':<{width}}  Part 1  Part 2  Input"]
+    for entry in entries:
+        lines.append(
+            f"{entry.year:<5} {entry.day:>3}  {entry.class_name or '?':<{width}}  "
+            f"{'yes' if entry.part1 else '-':<6}  {'yes' if entry.part2 else '-':<6}  "
+            f"{'yes' if entry.input_path.exists() else 'missing'}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,100 @@
+"""Sets of integers stored as sorted, merged, inclusive ranges.
+
+:class:`IntervalSet` sorts and merges its ranges once into two parallel ``array('q')``
+columns, ``starts`` and ``ends``. A membership test is then one :func:`bisect.bisect_right`
+over ``starts``; a whole batch of values is tested with a single
+:func:`numpy.searchsorted` call when NumPy is installed (``pip install .[numpy]``).
+Bounds must fit in a signed 64-bit integer.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from ._compat import numpy
+
+
+class IntervalSet:
+    """Inclusive integer ranges, merged so that no two overlap or touch."""
+
+    __slots__ = ("starts", "ends")
+
+    def __init__(self, ranges: Iterable[tuple[int, int]] = ()):
+        self.starts = array("q")
+        self.ends = array("q")
+        for start, end in sorted(ranges):
+            if start > end:
+                raise ValueError(f"Range {start}-{end} ends before it starts.")
+            if self.ends and start <= self.ends[-1] + 1:
+                if end > self.ends[-1]:
+                    self.ends[-1] = end
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+
+    @classmethod
+    def from_arrays(cls, starts: Any, ends: Any) -> IntervalSet:
+        """Build from two equally long integer sequences, merging them inside NumPy."""
+
+        if numpy is None:
+            return cls(zip(starts, ends))
+        starts = numpy.asarray(starts, dtype=numpy.int64)
+        ends = numpy.asarray(ends, dtype=numpy.int64)
+        if starts.shape != ends.shape:
+            raise ValueError("starts and ends must have the same length.")
+        if numpy.any(starts > ends):
+            raise ValueError("Every range must end at or after its start.")
+        interval_set = cls()
+        if not len(starts):
+            return interval_set
+        order = numpy.argsort(starts, kind="stable")
+        starts, ends = starts[order], ends[order]
+        # A range opens a new merged interval when it starts past everything before it.
+        reach = numpy.maximum.accumulate(ends)
+        opens = numpy.ones(len(starts), dtype=bool)
+        opens[1:] = starts[1:] > reach[:-1] + 1
+        first = numpy.flatnonzero(opens)
+        last = numpy.append(first[1:] - 1, len(starts) - 1)
+        interval_set.starts.frombytes(starts[first].tobytes())
+        interval_set.ends.frombytes(reach[last].tobytes())
+        return interval_set
+
+    def __len__(self) -> int:
+        """Number of merged ranges (not of covered integers; see :meth:`covered`)."""
+
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return zip(self.starts, self.ends)
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)!r})"
+
+    def __contains__(self, value: int) -> bool:
+        index = bisect_right(self.starts, value) - 1
+        return index >= 0 and value <= self.ends[index]
+
+    def covered(self) -> int:
+        """How many integers the ranges cover together."""
+
+        return sum(self.ends) - sum(self.starts) + len(self.starts)
+
+    def count_members(self, values: Iterable[int]) -> int:
+        """How many of ``values`` fall inside the set (duplicates count every time)."""
+
+        if numpy is None:
+            return sum(map(self.__contains__, values))
+        if isinstance(values, Iterator):
+            values = numpy.fromiter(values, dtype=numpy.int64)
+        # Sorted queries walk ``starts`` in order: several times faster than random probes.
+        values = numpy.sort(numpy.asarray(values, dtype=numpy.int64))
+        if not len(values) or not len(self.starts):
+            return 0
+        starts = numpy.frombuffer(self.starts, dtype=numpy.int64)
+        ends = numpy.frombuffer(self.ends, dtype=numpy.int64)
+        index = numpy.searchsorted(starts, values, side="right") - 1
+        inside = values <= ends[numpy.maximum(index, 0)]
+        return int(numpy.count_nonzero(inside & (index >= 0)))
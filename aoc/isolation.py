@@ -0,0 +1,122 @@
+"""Run challenge parts in child processes with wall-clock and address-space limits."""
+
+from __future__ import annotations
+
+import multiprocessing
+import signal
+import traceback
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from time import perf_counter
+
+from .base import BaseChallenge, ParsedInputCache
+from .memory import resource
+from .runner import PartResult, run_challenge
+
+
+@dataclass(slots=True, frozen=True)
+class IsolationLimits:
+    """Limits applied to every isolated part; ``None`` means unlimited."""
+
+    timeout: float | None = None
+    max_memory_mb: int | None = None
+
+
+def _apply_memory_limit(max_memory_mb: int | None) -> None:
+    if max_memory_mb is None or resource is None:
+        return
+    limit = max_memory_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _child_main(
+    conn: Connection,
+    challenge: BaseChallenge,
+    part: str,
+    limits: IsolationLimits,
+    parse_cache: ParsedInputCache | None,
+    profile: bool,
+    track_memory: bool,
+    gc_mode: str | None,
+) -> None:
+    try:
+        _apply_memory_limit(limits.max_memory_mb)
+        [result] = run_challenge(
+            challenge,
+            part=part,
+            parse_cache=parse_cache,
+            profile=profile,
+            track_memory=track_memory,
+            gc_mode=gc_mode,
+        )
+        conn.send(("ok", result))
+    except MemoryError:
+        conn.send(("oom", "MemoryError"))
+    except BaseException as exc:  # noqa: BLE001 - every failure is reported to the parent
+        summary = traceback.format_exception_only(type(exc), exc)[-1].strip()
+        conn.send(("error", summary))
+    finally:
+        conn.close()
+
+
+def run_part_isolated(
+    challenge: BaseChallenge,
+    part: str,
+    limits: IsolationLimits,
+    *,
+    parse_cache: ParsedInputCache | None = None,
+    profile: bool = False,
+    track_memory: bool = False,
+    gc_mode: str | None = None,
+) -> PartResult:
+    """Read, parse and solve one part in a child process.
+
+    Timeouts, memory exhaustion and exceptions come back as a :class:`PartResult`
+    whose ``status`` is ``"timeout"``, ``"oom"`` or ``"error"`` instead of raising.
+    """
+
+    context = multiprocessing.get_context()
+    parent_conn, child_conn = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_child_main,
+        args=(child_conn, challenge, part, limits, parse_cache, profile, track_memory, gc_mode),
+        daemon=True,
+    )
+    start = perf_counter()
+    process.start()
+    child_conn.close()
+
+    try:
+        if parent_conn.poll(limits.timeout):
+            try:
+                status, payload = parent_conn.recv()
+            except EOFError:
+                status, payload = None, None
+        else:
+            process.kill()
+            process.join()
+            elapsed_ms = (perf_counter() - start) * 1000
+            return PartResult(
+                part=part,
+                answer="",
+                duration_ms=elapsed_ms,
+                status="timeout",
+                error=f"exceeded {limits.timeout:g} s wall-clock limit",
+            )
+    finally:
+        parent_conn.close()
+
+    process.join()
+    elapsed_ms = (perf_counter() - start) * 1000
+    if status == "ok":
+        return payload
+    if status is None:
+        # The child died without reporting back; SIGKILL almost always means the OOM killer.
+        exitcode = process.exitcode
+        if exitcode == -signal.SIGKILL:
+            status, payload = "oom", "killed by SIGKILL"
+        else:
+            status, payload = "error", f"child exited with code {exitcode}"
+    if status == "oom" and limits.max_memory_mb is not None:
+        payload = f"{payload} (limit {limits.max_memory_mb} MiB)"
+    return PartResult(part=part, answer="", duration_ms=elapsed_ms, status=status, error=payload)
@@ -0,0 +1,66 @@
+"""Per-part memory accounting via tracemalloc and the process resource usage."""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from dataclasses import dataclass
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+
+@dataclass(slots=True)
+class MemoryUsage:
+    peak_kb: float
+    net_kb: float
+    max_rss_kb: float | None
+
+
+def max_rss_kb() -> float | None:
+    """Return the process high-water resident set size in KiB, when the platform reports it."""
+
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    return max_rss / 1024 if sys.platform == "darwin" else float(max_rss)
+
+
+class MemoryTracker:
+    """Trace Python allocations made between :meth:`start` and :meth:`stop`.
+
+    ``peak_kb`` is the highest traced usage above the starting point and ``net_kb``
+    is what is still allocated when the solver returns (e.g. caches it retained).
+    """
+
+    def __init__(self) -> None:
+        self._baseline = 0
+        self._owns_tracing = False
+
+    def start(self) -> None:
+        self._owns_tracing = not tracemalloc.is_tracing()
+        if self._owns_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._baseline = tracemalloc.get_traced_memory()[0]
+
+    def stop(self) -> MemoryUsage:
+        current, peak = tracemalloc.get_traced_memory()
+        if self._owns_tracing:
+            tracemalloc.stop()
+        return MemoryUsage(
+            peak_kb=max(0, peak - self._baseline) / 1024,
+            net_kb=(current - self._baseline) / 1024,
+            max_rss_kb=max_rss_kb(),
+        )
+
+
+def format_kb(value: float) -> str:
+    if abs(value) >= 1024 * 1024:
+        return f"{value / (1024 * 1024):.2f} GiB"
+    if abs(value) >= 1024:
+        return f"{value / 1024:.2f} MiB"
+    return f"{value:.1f} KiB"
@@ -0,0 +1,235 @@
+"""Run many Advent of Code challenges, or both parts of one, at once across process pools."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from time import perf_counter
+
+from .base import BaseChallenge, ParsedInputCache
+from .cache import ResultCache
+from .isolation import IsolationLimits
+from .memory import format_kb
+from .runner import PartResult, _solve_parts, discover_days, load_challenge, run_challenge
+
+_ANSWER_WIDTH = 36
+
+
+@dataclass(slots=True)
+class DayResult:
+    day: int
+    wall_ms: float
+    results: list[PartResult] = field(default_factory=list)
+    error: str | None = None
+    input_digest: str | None = None
+
+
+def _run_day(
+    year: int,
+    day: int,
+    part: str | None,
+    parse_cache: ParsedInputCache | None,
+    result_cache: ResultCache | None,
+    refresh: bool,
+    track_memory: bool,
+    isolation: IsolationLimits | None,
+    gc_mode: str | None,
+) -> DayResult:
+    """Worker entry point: import, run and time one day inside a pool process."""
+
+    start = perf_counter()
+    try:
+        challenge = load_challenge(year, day)
+        results = run_challenge(
+            challenge,
+            part=part,
+            parse_cache=parse_cache,
+            result_cache=result_cache,
+            refresh=refresh,
+            track_memory=track_memory,
+            isolation=isolation,
+            gc_mode=gc_mode,
+        )
+        input_digest = challenge.input_digest()
+    except Exception as exc:  # noqa: BLE001 - one broken day must not sink the whole suite
+        wall_ms = (perf_counter() - start) * 1000
+        return DayResult(day=day, wall_ms=wall_ms, error=f"{type(exc).__name__}: {exc}")
+    return DayResult(
+        day=day,
+        wall_ms=(perf_counter() - start) * 1000,
+        results=results,
+        input_digest=input_digest,
+    )
+
+
+def run_year(
+    year: int,
+    *,
+    part: str | None = None,
+    jobs: int | None = None,
+    parse_cache: ParsedInputCache | None = None,
+    result_cache: ResultCache | None = None,
+    refresh: bool = False,
+    track_memory: bool = False,
+    isolation: IsolationLimits | None = None,
+    gc_mode: str | None = None,
+) -> tuple[list[DayResult], float]:
+    """Run every discovered day of ``year`` and return per-day results plus total wall time."""
+
+    days = discover_days(year)
+    start = perf_counter()
+    day_results: list[DayResult] = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            pool.submit(
+                _run_day,
+                year,
+                day,
+                part,
+                parse_cache,
+                result_cache,
+                refresh,
+                track_memory,
+                isolation,
+                gc_mode,
+            )
+            for day in days
+        ]
+        for future in as_completed(futures):
+            day_results.append(future.result())
+    total_ms = (perf_counter() - start) * 1000
+    day_results.sort(key=lambda result: result.day)
+    return day_results, total_ms
+
+
+def _solve_shared_part(
+    challenge: BaseChallenge,
+    part: str,
+    shm_name: str,
+    size: int,
+    parse_cache: ParsedInputCache | None,
+    profile: bool,
+    track_memory: bool,
+    gc_mode: str,
+) -> PartResult:
+    """Worker entry point: parse the shared input bytes and solve a single part."""
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        view = shm.buf[:size]
+        challenge.use_input_buffer(view)
+        try:
+            [result] = _solve_parts(
+                challenge,
+                [part],
+                parse_cache=parse_cache,
+                profile=profile,
+                track_memory=track_memory,
+                gc_mode=gc_mode,
+            ).values()
+        finally:
+            challenge.use_input_buffer(None)
+            view.release()
+    finally:
+        shm.close()
+    return result
+
+
+def solve_parts_concurrently(
+    challenge: BaseChallenge,
+    parts: Sequence[str],
+    *,
+    parse_cache: ParsedInputCache | None = None,
+    profile: bool = False,
+    track_memory: bool = False,
+    gc_mode: str = "default",
+) -> dict[str, PartResult]:
+    """Solve ``parts`` at the same time, one process each, over one shared copy of the input.
+
+    The input file is read once into a :class:`~multiprocessing.shared_memory.SharedMemory`
+    block; workers receive only its name, so the bytes are neither re-read nor pickled.
+    Each worker still runs :meth:`~aoc.base.BaseChallenge.parse` itself, in parallel.
+    """
+
+    payload = challenge.read_input_bytes()
+    size = len(payload)
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    try:
+        shm.buf[:size] = payload
+        del payload
+        with ProcessPoolExecutor(max_workers=len(parts)) as pool:
+            futures = {
+                part: pool.submit(
+                    _solve_shared_part,
+                    challenge,
+                    part,
+                    shm.name,
+                    size,
+                    parse_cache,
+                    profile,
+                    track_memory,
+                    gc_mode,
+                )
+                for part in parts
+            }
+            return {part: future.result() for part, future in futures.items()}
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _shorten(answer: str) -> str:
+    answer = " ".join(str(answer).split())
+    if len(answer) <= _ANSWER_WIDTH:
+        return answer
+    return answer[: _ANSWER_WIDTH - 3] + "..."
+
+
+def format_year_results(year: int, day_results: Iterable[DayResult], total_ms: float) -> str:
+    """Return a combined table with one row per day and the overall elapsed time."""
+
+    day_results = list(day_results)
+    part_header = f"{'Part 1':<{_ANSWER_WIDTH + 14}} {'Part 2':<{_ANSWER_WIDTH + 14}}"
+    header = f"Day  {'Parse':>11} {part_header} {'Wall':>12}"
+    rule = "=" * len(header)
+    lines = [f"===== Advent of Code {year} =====", header, rule]
+
+    for day_result in day_results:
+        parse_cell = f"{'-':>11}"
+        if day_result.error is not None:
+            cells = f"{'error: ' + day_result.error:<{2 * (_ANSWER_WIDTH + 14) + 1}}"
+        else:
+            parsed = next((result for result in day_result.results if result.status == "ok"), None)
+            if parsed is not None:
+                parse_cell = f"{parsed.parse_ms:>8.2f} ms"
+            by_part = {result.part: result for result in day_result.results}
+            rendered: list[str] = []
+            for part in ("1", "2"):
+                result = by_part.get(part)
+                if result is None:
+                    rendered.append(f"{'-':<{_ANSWER_WIDTH + 14}}")
+                    continue
+                if result.status != "ok":
+                    text = f"[{result.status}] {_shorten(result.error or '')}"
+                    rendered.append(f"{text:<{_ANSWER_WIDTH + 14}}")
+                    continue
+                marker = "*" if result.cached else ""
+                if result.peak_memory_kb is not None:
+                    marker += f", peak {format_kb(result.peak_memory_kb)}"
+                text = f"{_shorten(result.answer)} ({result.duration_ms:.2f} ms{marker})"
+                rendered.append(f"{text:<{_ANSWER_WIDTH + 14}}")
+            cells = " ".join(rendered)
+        lines.append(f"{day_result.day:02d}   {parse_cell} {cells} {day_result.wall_ms:>9.2f} ms")
+
+    lines.append(rule)
+    slowest = max((result.wall_ms for result in day_results), default=0.0)
+    summed = sum(result.wall_ms for result in day_results)
+    lines.append(
+        f"Total elapsed: {total_ms:.2f} ms "
+        f"(slowest day {slowest:.2f} ms, sum of days {summed:.2f} ms)"
+    )
+    if any(result.cached for day_result in day_results for result in day_result.results):
+        lines.append("* cached answer; timing is from the original run")
+    return "\n".join(lines)
@@ -0,0 +1,145 @@
+"""Whole-buffer parsing primitives that make a single C-level pass over the input.
+
+Per-line ``split``/``int`` loops run Python bytecode for every token. These helpers hand
+the entire buffer to C instead: one ``bytes.translate`` that blanks every non-number
+byte, one ``split``, and ``int`` mapped over the tokens (a compiled regex takes over
+when a stray ``-`` makes that ambiguous). They return compact containers:
+``array('q')`` by default, or NumPy arrays when NumPy is installed
+(``pip install .[numpy]``).
+"""
+
+from __future__ import annotations
+
+import mmap
+import re
+from array import array
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from ._compat import numpy
+from .base import RawInput
+
+if TYPE_CHECKING:
+    Buffer = bytes | bytearray | memoryview | mmap.mmap | RawInput | str
+
+_SIGNED_INT = re.compile(rb"-?\d+")
+
+
+def as_bytes(data: Buffer) -> bytes | bytearray | mmap.mmap:
+    """Return the raw bytes behind ``data`` without copying where possible."""
+
+    if isinstance(data, RawInput):
+        return data.data
+    if isinstance(data, str):
+        return data.encode("utf-8")
+    if isinstance(data, memoryview):
+        return data.tobytes()
+    return data
+
+
+@lru_cache(maxsize=32)
+def sign_table(*, signed: bool = True, negative: bytes = b"") -> bytes:
+    """Translation table keeping digits (and ``-`` when ``signed``), mapping each
+    ``negative`` byte to ``-`` and every other byte to a space.
+
+    ``ints(data, negative=b"L")`` turns ``L68`` into ``-68`` and ``R48`` into ``48``
+    in the same pass that separates the numbers.
+    """
+
+    keep = set(b"0123456789-" if signed else b"0123456789")
+    table = bytearray(byte if byte in keep else 0x20 for byte in range(256))
+    for byte in negative:
+        table[byte] = 0x2D
+    return bytes(table)
+
+
+def ints(data: Buffer, *, signed: bool = True, negative: bytes = b"") -> array:
+    """Every integer in ``data``, in order, as an ``array('q')``.
+
+    With ``signed`` a ``-`` directly before digits is a minus sign; pass
+    ``signed=False`` for inputs that use ``-`` as a separator (``"3-5"``).
+    ``negative`` names prefix letters to read as minus signs (see :func:`sign_table`);
+    any other letter is just a separator. Values must fit in a signed 64-bit integer.
+    """
+
+    signed = signed or bool(negative)
+    buffer = as_bytes(data)
+    if isinstance(buffer, mmap.mmap):
+        buffer = buffer[:]
+    tokens = buffer.translate(sign_table(signed=signed, negative=negative)).split()
+    try:
+        return array("q", map(int, tokens))
+    except ValueError:
+        # A "-" that is a separator ("3-5") or dangling ("a - b"): let the regex decide.
+        translated = buffer.translate(sign_table(signed=True, negative=negative))
+        return array("q", map(int, _SIGNED_INT.findall(translated)))
+
+
+def records(data: Buffer, columns: int, *, signed: bool = True) -> list[tuple[int, ...]]:
+    """The integers of ``data`` grouped into ``columns``-wide tuples, e.g. one per ``x,y,z`` line."""
+
+    values = ints(data, signed=signed)
+    if columns < 1 or len(values) % columns:
+        raise ValueError(f"Found {len(values)} integers, not a multiple of {columns} columns.")
+    return list(zip(*[iter(values)] * columns))
+
+
+def _require_numpy() -> Any:
+    if numpy is None:
+        raise ModuleNotFoundError(
+            "NumPy is not installed; use ints()/records() or install the 'numpy' extra."
+        )
+    return numpy
+
+
+def ints_numpy(data: Buffer, *, signed: bool = True, negative: bytes = b"") -> Any:
+    """Like :func:`ints`, as a ``numpy.int64`` array, parsed entirely inside NumPy.
+
+    Digit runs are found with boolean masks over the bytes, then each number is
+    assembled right to left, one vectorized gather per digit position, so no
+    Python object is created per number.
+    """
+
+    np = _require_numpy()
+    signed = signed or bool(negative)
+    buffer = as_bytes(data)
+    digits = np.frombuffer(buffer, dtype=np.uint8) - 48  # non-digits wrap around above 9
+    is_digit = digits < 10
+    first = is_digit.copy()
+    first[1:] &= ~is_digit[:-1]
+    last = is_digit.copy()
+    last[:-1] &= ~is_digit[1:]
+    starts = np.flatnonzero(first)
+    ends = np.flatnonzero(last)
+    if not len(starts):
+        return np.zeros(0, dtype=np.int64)
+    lengths = ends - starts + 1
+    longest, shortest = int(lengths.max()), int(lengths.min())
+    if longest > 18:
+        # Beyond the exact int64 place values: let the Python path raise or convert.
+        return np.asarray(ints(buffer, signed=signed, negative=negative), dtype=np.int64)
+
+    values = digits[ends].astype(np.int64)
+    for place in range(1, longest):
+        column = digits[ends - place].astype(np.int64)
+        if place >= shortest:
+            column[lengths <= place] = 0
+        column *= 10**place
+        values += column
+
+    sign_bytes = (b"-" if signed else b"") + negative
+    if sign_bytes:
+        is_sign = np.zeros(256, dtype=bool)
+        is_sign[list(sign_bytes)] = True
+        minus = is_sign[digits[starts - 1] + 48] & (starts > 0)
+        np.negative(values, out=values, where=minus)
+    return values
+
+
+def records_numpy(data: Buffer, columns: int, *, signed: bool = True) -> Any:
+    """Like :func:`records`, as an ``(n, columns)`` ``numpy.int64`` array."""
+
+    values = ints_numpy(data, signed=signed)
+    if columns < 1 or len(values) % columns:
+        raise ValueError(f"Found {len(values)} integers, not a multiple of {columns} columns.")
+    return values.reshape(-1, columns)
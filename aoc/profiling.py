@@ -0,0 +1,104 @@
+"""cProfile integration: per-part profiles, top-N reports and collapsed stacks."""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+#: Raw ``pstats`` table: ``{(file, line, name): (cc, nc, tt, ct, callers)}``.
+ProfileStats = dict[tuple[str, int, str], tuple[Any, ...]]
+
+_MAX_STACK_DEPTH = 128
+_MIN_STACK_MICROS = 1.0
+
+
+class _LoadedStats:
+    """Adapter letting :class:`pstats.Stats` read an already collected table."""
+
+    def __init__(self, stats: ProfileStats):
+        self.stats = dict(stats)
+
+    def create_stats(self) -> None:
+        pass
+
+
+def profile_solver(solver: Callable[[Any], str], data: Any) -> tuple[str, float, ProfileStats]:
+    """Run ``solver`` under cProfile; the duration includes the profiler's overhead."""
+
+    profiler = cProfile.Profile()
+    start = perf_counter()
+    answer = profiler.runcall(solver, data)
+    duration_ms = (perf_counter() - start) * 1000
+    profiler.create_stats()
+    return answer, duration_ms, profiler.stats
+
+
+def format_profile(stats: ProfileStats, *, top: int = 25) -> str:
+    """Return the ``top`` functions sorted by cumulative time."""
+
+    stream = io.StringIO()
+    report = pstats.Stats(_LoadedStats(stats), stream=stream)
+    report.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    return stream.getvalue().strip("\n")
+
+
+def _frame_label(func: tuple[str, int, str]) -> str:
+    filename, lineno, name = func
+    if filename == "~":
+        label = name
+    else:
+        label = f"{name} ({Path(filename).name}:{lineno})"
+    return label.replace(";", ":")
+
+
+def collapsed_stacks(stats: ProfileStats) -> dict[str, int]:
+    """Approximate collapsed stacks (``a;b;c -> microseconds``) from a cProfile table.
+
+    cProfile only records caller/callee pairs, so each edge's cumulative time is
+    split proportionally down the call graph. Recursive edges are cut at the
+    first repeat, which keeps flame graphs readable.
+    """
+
+    callees: dict[tuple[str, int, str], list[tuple[tuple[str, int, str], float]]] = defaultdict(list)
+    roots: list[tuple[str, int, str]] = []
+    for func, (_, _, _, _, callers) in stats.items():
+        known_callers = [caller for caller in callers if caller in stats]
+        if not known_callers:
+            roots.append(func)
+        for caller in known_callers:
+            callees[caller].append((func, callers[caller][3]))
+
+    stacks: dict[str, float] = defaultdict(float)
+
+    def walk(func: tuple[str, int, str], budget: float, path: list[tuple[str, int, str]]) -> None:
+        _, _, own_time, cumulative, _ = stats[func]
+        scale = budget / cumulative if cumulative else 0.0
+        self_micros = own_time * scale * 1e6
+        if self_micros >= _MIN_STACK_MICROS:
+            stacks[";".join(_frame_label(frame) for frame in path)] += self_micros
+        if len(path) >= _MAX_STACK_DEPTH:
+            return
+        for callee, edge_time in callees.get(func, []):
+            if callee in path or edge_time * scale * 1e6 < _MIN_STACK_MICROS:
+                continue
+            walk(callee, edge_time * scale, [*path, callee])
+
+    for root in roots:
+        walk(root, stats[root][3], [root])
+    return {stack: round(micros) for stack, micros in stacks.items() if round(micros) > 0}
+
+
+def write_collapsed(profiles: Iterable[tuple[str, ProfileStats]], path: Path) -> None:
+    """Write one collapsed-stack file, rooting each profile under its own label."""
+
+    lines: list[str] = []
+    for label, stats in profiles:
+        for stack, micros in sorted(collapsed_stacks(stats).items()):
+            lines.append(f"{label};{stack} {micros}")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
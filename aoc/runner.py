@@ -3,13 +3,24 @@
 from __future__ import annotations
 
 import importlib
-from collections.abc import Iterable
+import importlib.util
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from pathlib import Path
 from time import perf_counter
 from types import ModuleType
+from typing import TYPE_CHECKING, Any
 
-from .base import BaseChallenge, ChallengeIdentity
+from . import YEARS_DIR
+from .base import BaseChallenge, ChallengeIdentity, ParsedInputCache
+from .cache import ResultCache
+from .gctune import GcMonitor, validate_gc_mode
+from .index import SolutionIndex
+from .memory import MemoryTracker, format_kb
+from .profiling import ProfileStats, profile_solver
+
+if TYPE_CHECKING:
+    from .isolation import IsolationLimits
 
 
 @dataclass(slots=True)
@@ -17,12 +28,39 @@ class PartResult:
     part: str
     answer: str
     duration_ms: float
+    parse_ms: float = 0.0
+    cached: bool = False
+    profile: ProfileStats | None = None
+    peak_memory_kb: float | None = None
+    net_alloc_kb: float | None = None
+    max_rss_kb: float | None = None
+    status: str = "ok"
+    error: str | None = None
+    gc_mode: str = "default"
+    gc_collections: int | None = None
+    gc_ms: float | None = None
+
+
+def discover_days(year: int) -> list[int]:
+    """Return the sorted day numbers that have a ``dayNN.py`` module for ``year``.
+
+    Days come from the :class:`~aoc.index.SolutionIndex`, so none of them is imported.
+    """
+
+    solutions_dir = YEARS_DIR / f"y{year}" / "solutions"
+    if not solutions_dir.is_dir():
+        raise FileNotFoundError(f"No solutions directory for {year}: {solutions_dir}")
+    return [entry.day for entry in SolutionIndex().entries(year)]
+
+
+def challenge_module_name(year: int, day: int) -> str:
+    return f"aoc.years.y{year}.solutions.day{day:02d}"
 
 
 def load_challenge(year: int, day: int, *, input_path: Path | None = None) -> BaseChallenge:
     """Dynamically import the requested challenge module and instantiate its class."""
 
-    module_name = f"aoc.years.y{year}.solutions.day{day:02d}"
+    module_name = challenge_module_name(year, day)
     try:
         module = importlib.import_module(module_name)
     except ModuleNotFoundError as exc:  # pragma: no cover - raised only for invalid requests
@@ -30,15 +68,30 @@ def load_challenge(year: int, day: int, *, input_path: Path | None = None) -> Ba
             f"Could not locate module '{module_name}'. Did you scaffold the day yet?"
         ) from exc
 
-    challenge_cls = _locate_challenge_class(module)
+    entry = SolutionIndex().get(year, day)
+    challenge_cls = _locate_challenge_class(module, entry.class_name if entry else None)
     identity = ChallengeIdentity(year=year, day=day)
     return challenge_cls(identity=identity, input_path=input_path)
 
 
-def _locate_challenge_class(module: ModuleType) -> type[BaseChallenge]:
-    candidate = getattr(module, "Challenge", None)
-    if isinstance(candidate, type) and issubclass(candidate, BaseChallenge):
-        return candidate
+def reload_module(module: ModuleType) -> ModuleType:
+    """Re-execute an edited solution module in place.
+
+    The cached bytecode is dropped first: it is validated by whole-second mtime and
+    size, so a same-size edit made within a second would otherwise load stale code.
+    """
+
+    if module.__file__ is not None:
+        Path(importlib.util.cache_from_source(module.__file__)).unlink(missing_ok=True)
+    return importlib.reload(module)
+
+
+def _locate_challenge_class(module: ModuleType, class_name: str | None = None) -> type[BaseChallenge]:
+    # The index already names the class statically; scanning is only the fallback.
+    for name in (class_name, "Challenge"):
+        candidate = getattr(module, name, None) if name else None
+        if isinstance(candidate, type) and issubclass(candidate, BaseChallenge):
+            return candidate
 
     # Fallback: find the first exported subclass of BaseChallenge.
     for value in vars(module).values():
@@ -51,31 +104,210 @@ def _locate_challenge_class(module: ModuleType) -> type[BaseChallenge]:
     )
 
 
-def run_challenge(challenge: BaseChallenge, *, part: str | None = None) -> list[PartResult]:
-    """Execute the requested parts and collect timings."""
+def run_challenge(
+    challenge: BaseChallenge,
+    *,
+    part: str | None = None,
+    parse_cache: ParsedInputCache | None = None,
+    result_cache: ResultCache | None = None,
+    refresh: bool = False,
+    profile: bool = False,
+    track_memory: bool = False,
+    isolation: IsolationLimits | None = None,
+    concurrent: bool = False,
+    gc_mode: str | None = None,
+) -> list[PartResult]:
+    """Execute the requested parts and collect timings.
 
-    raw_input = challenge.read_input()
-    parts_to_run: list[str]
-    if part is None or part == "both":
-        parts_to_run = ["1", "2"]
-    else:
-        parts_to_run = [part]
-
-    results: list[PartResult] = []
-    for current_part in parts_to_run:
-        solver = challenge.solve_part1 if current_part == "1" else challenge.solve_part2
-        start = perf_counter()
-        answer = solver(list(raw_input))
-        duration_ms = (perf_counter() - start) * 1000
-        results.append(PartResult(part=current_part, answer=answer, duration_ms=duration_ms))
+    With a ``result_cache``, parts whose solution source, framework source and input
+    are unchanged return their stored answer and original timing, flagged as
+    ``cached``; ``refresh`` recomputes them and overwrites the stored entries.
+    ``profile`` runs every solver under cProfile and ``track_memory`` records its
+    tracemalloc peak, net allocations and the process max RSS; both bypass the
+    result cache because they need a real run and inflate the measured timings.
+    With ``isolation``, each pending part is read, parsed and solved in its own
+    child process; failures come back as results with a non-``"ok"`` status.
+    ``concurrent`` solves the pending parts simultaneously in separate processes
+    that share one in-memory copy of the input. ``gc_mode`` overrides the
+    challenge's :attr:`~aoc.base.BaseChallenge.gc_mode` for the solves and, like
+    ``profile``, bypasses the result cache so the collections are really measured.
+    """
+
+    # An explicit gc_mode is a measurement request too: a cached run has no collections.
+    if profile or track_memory or gc_mode is not None:
+        result_cache = None
+    gc_mode = validate_gc_mode(gc_mode or challenge.gc_mode)
+    requested = parts_to_run(part)
+    entries: dict[str, Path] = {}
+    cached: dict[str, PartResult] = {}
+    if result_cache is not None:
+        input_digest = challenge.input_digest()
+        for current_part in requested:
+            entries[current_part] = result_cache.entry_path(challenge, current_part, input_digest)
+            record = None if refresh else result_cache.load(entries[current_part])
+            if record is not None:
+                cached[current_part] = PartResult(
+                    part=current_part,
+                    answer=record["answer"],
+                    duration_ms=record["duration_ms"],
+                    parse_ms=record["parse_ms"],
+                    cached=True,
+                )
+
+    pending = [current_part for current_part in requested if current_part not in cached]
+    fresh: dict[str, PartResult] = {}
+    if pending and isolation is not None:
+        from .isolation import run_part_isolated
+
+        for current_part in pending:
+            fresh[current_part] = run_part_isolated(
+                challenge,
+                current_part,
+                isolation,
+                parse_cache=parse_cache,
+                profile=profile,
+                track_memory=track_memory,
+                gc_mode=gc_mode,
+            )
+    elif concurrent and len(pending) > 1:
+        from .parallel import solve_parts_concurrently
+
+        fresh = solve_parts_concurrently(
+            challenge,
+            pending,
+            parse_cache=parse_cache,
+            profile=profile,
+            track_memory=track_memory,
+            gc_mode=gc_mode,
+        )
+    elif pending:
+        fresh = _solve_parts(
+            challenge,
+            pending,
+            parse_cache=parse_cache,
+            profile=profile,
+            track_memory=track_memory,
+            gc_mode=gc_mode,
+        )
+
+    if result_cache is not None:
+        for current_part, result in fresh.items():
+            if result.status == "ok":
+                result_cache.store(
+                    entries[current_part],
+                    {
+                        "answer": result.answer,
+                        "duration_ms": result.duration_ms,
+                        "parse_ms": result.parse_ms,
+                    },
+                )
+    return [cached.get(current_part) or fresh[current_part] for current_part in requested]
+
+
+def _solve_parts(
+    challenge: BaseChallenge,
+    parts: list[str],
+    *,
+    parse_cache: ParsedInputCache | None,
+    profile: bool,
+    track_memory: bool,
+    gc_mode: str = "default",
+) -> dict[str, PartResult]:
+    """Parse once in this process and solve each of ``parts`` against the shared data."""
+
+    data, parse_ms = prepare_input(challenge, parse_cache=parse_cache)
+    results: dict[str, PartResult] = {}
+    for current_part in parts:
+        solver = select_solver(challenge, current_part)
+        stats = None
+        tracker = MemoryTracker() if track_memory else None
+        if tracker is not None:
+            tracker.start()
+        monitor = GcMonitor(gc_mode)
+        monitor.start()
+        try:
+            if profile:
+                answer, duration_ms, stats = profile_solver(solver, data)
+            else:
+                answer, duration_ms = time_solver(solver, data)
+        finally:
+            gc_usage = monitor.stop()
+        result = PartResult(
+            part=current_part,
+            answer=answer,
+            duration_ms=duration_ms,
+            parse_ms=parse_ms,
+            profile=stats,
+            gc_mode=gc_mode,
+            gc_collections=gc_usage.collections,
+            gc_ms=gc_usage.gc_ms,
+        )
+        if tracker is not None:
+            usage = tracker.stop()
+            result.peak_memory_kb = usage.peak_kb
+            result.net_alloc_kb = usage.net_kb
+            result.max_rss_kb = usage.max_rss_kb
+        results[current_part] = result
     return results
 
 
+def prepare_input(
+    challenge: BaseChallenge, *, parse_cache: ParsedInputCache | None = None
+) -> tuple[Any, float]:
+    """Read and parse the challenge input once, returning the data and elapsed milliseconds."""
+
+    start = perf_counter()
+    data = challenge.parse_input(cache=parse_cache)
+    return data, (perf_counter() - start) * 1000
+
+
+def parts_to_run(part: str | None) -> list[str]:
+    """Expand the CLI ``--part`` choice into the list of parts to execute."""
+
+    if part is None or part == "both":
+        return ["1", "2"]
+    return [part]
+
+
+def select_solver(challenge: BaseChallenge, part: str) -> Callable[[Any], str]:
+    return challenge.solve_part1 if part == "1" else challenge.solve_part2
+
+
+def time_solver(solver: Callable[[Any], str], data: Any) -> tuple[str, float]:
+    """Call ``solver`` once and return its answer with the elapsed wall time in milliseconds."""
+
+    start = perf_counter()
+    answer = solver(data)
+    return answer, (perf_counter() - start) * 1000
+
+
 def format_results(results: Iterable[PartResult]) -> str:
     """Return a printable string summarizing the results."""
 
+    results = list(results)
     lines = ["===== Advent of Code ====="]
+    parsed = next((result for result in results if result.status == "ok"), None)
+    if parsed is not None:
+        lines.append(f"Parse: {parsed.parse_ms:.2f} ms")
     for result in results:
-        lines.append(f"Part {result.part}: {result.answer} ({result.duration_ms:.2f} ms)")
+        if result.status != "ok":
+            lines.append(
+                f"Part {result.part}: [{result.status}] {result.error} ({result.duration_ms:.2f} ms)"
+            )
+            continue
+        suffix = " [cached]" if result.cached else ""
+        lines.append(f"Part {result.part}: {result.answer} ({result.duration_ms:.2f} ms){suffix}")
+        if result.peak_memory_kb is not None:
+            memory = (
+                f"  memory: peak {format_kb(result.peak_memory_kb)}, "
+                f"net {'+' if result.net_alloc_kb >= 0 else ''}{format_kb(result.net_alloc_kb)}"
+            )
+            if result.max_rss_kb is not None:
+                memory += f", max RSS {format_kb(result.max_rss_kb)}"
+            lines.append(memory)
+        if result.gc_collections or (result.gc_collections is not None and result.gc_mode != "default"):
+            lines.append(
+                f"  gc ({result.gc_mode}): {result.gc_collections} collections, {result.gc_ms:.2f} ms"
+            )
     lines.append("==========================")
     return "\n".join(lines)
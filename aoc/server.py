@@ -0,0 +1,144 @@
+"""Warm solver daemon: keeps solution modules imported and answers over a Unix socket.
+
+Protocol: the client sends one JSON object per connection, terminated by a newline,
+and receives one JSON object back. Requests look like
+``{"year": 2025, "day": 8, "part": "both", "input": "/abs/path" | null}``
+(or ``"input_text"`` with the puzzle input itself); ``{"command": "shutdown"}``
+stops the server.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import socketserver
+import tempfile
+import threading
+import traceback
+from dataclasses import asdict
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from . import YEARS_DIR
+from .base import ChallengeIdentity
+from .client import DEFAULT_SOCKET
+from .runner import (
+    _locate_challenge_class,
+    challenge_module_name,
+    discover_days,
+    format_results,
+    reload_module,
+    run_challenge,
+)
+
+
+class ModuleRegistry:
+    """Imported solution modules, reloaded whenever their source file's mtime changes."""
+
+    def __init__(self) -> None:
+        self._modules: dict[tuple[int, int], tuple[ModuleType, int]] = {}
+
+    def preload(self) -> list[tuple[int, int]]:
+        loaded: list[tuple[int, int]] = []
+        for year_dir in sorted(YEARS_DIR.glob("y[0-9]*")):
+            year = int(year_dir.name[1:])
+            for day in discover_days(year):
+                try:
+                    self.module_for(year, day)
+                except Exception:  # noqa: BLE001 - a broken day is reported when requested
+                    continue
+                loaded.append((year, day))
+        return loaded
+
+    def module_for(self, year: int, day: int) -> ModuleType:
+        entry = self._modules.get((year, day))
+        if entry is None:
+            module = importlib.import_module(challenge_module_name(year, day))
+        else:
+            module, loaded_mtime = entry
+            if _mtime_ns(module) == loaded_mtime:
+                return module
+            module = reload_module(module)
+        self._modules[(year, day)] = (module, _mtime_ns(module))
+        return module
+
+
+def _mtime_ns(module: ModuleType) -> int:
+    return os.stat(module.__file__).st_mtime_ns
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: SolverServer
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+            response = self.server.dispatch(request)
+        except Exception as exc:  # noqa: BLE001 - errors go back to the client, not the log
+            response = {
+                "ok": False,
+                "error": "".join(traceback.format_exception_only(type(exc), exc)).strip(),
+            }
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class SolverServer(socketserver.UnixStreamServer):
+    """Serves one request at a time so module reloads never race a running solver."""
+
+    def __init__(self, socket_path: Path, registry: ModuleRegistry):
+        self.socket_path = socket_path
+        self.registry = registry
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        socket_path.unlink(missing_ok=True)
+        super().__init__(str(socket_path), _RequestHandler)
+
+    def dispatch(self, request: dict[str, Any]) -> dict[str, Any]:
+        if request.get("command") == "shutdown":
+            # shutdown() blocks until serve_forever returns, so it cannot run on this thread.
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"ok": True, "text": "server stopping"}
+
+        year, day = int(request["year"]), int(request["day"])
+        module = self.registry.module_for(year, day)
+        challenge_cls = _locate_challenge_class(module)
+
+        with tempfile.TemporaryDirectory(prefix="aoc-serve-") as workdir:
+            input_path = request.get("input")
+            if request.get("input_text") is not None:
+                input_path = Path(workdir) / "stdin.txt"
+                input_path.write_text(request["input_text"], encoding="utf-8")
+            challenge = challenge_cls(
+                identity=ChallengeIdentity(year=year, day=day),
+                input_path=Path(input_path) if input_path else None,
+            )
+            results = run_challenge(challenge, part=request.get("part") or "both")
+
+        return {
+            "ok": all(result.status == "ok" for result in results),
+            "text": format_results(results),
+            "results": [
+                {key: value for key, value in asdict(result).items() if key != "profile"}
+                for result in results
+            ],
+        }
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+
+def serve(socket_path: Path = DEFAULT_SOCKET, *, preload: bool = True) -> None:
+    """Run the daemon until interrupted or asked to shut down."""
+
+    registry = ModuleRegistry()
+    if preload:
+        loaded = registry.preload()
+        print(f"Preloaded {len(loaded)} solution modules.")
+    with SolverServer(socket_path, registry) as server:
+        print(f"Listening on {socket_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,254 @@
+"""Watch mode: rerun a day whenever its solution module or input file changes."""
+
+from __future__ import annotations
+
+import ast
+import importlib
+import os
+import sys
+import time
+import traceback
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from .base import BaseChallenge, ChallengeIdentity, ParsedInputCache, digest_bytes
+from .gctune import GcMonitor, validate_gc_mode
+from .runner import (
+    PartResult,
+    _locate_challenge_class,
+    challenge_module_name,
+    format_results,
+    parts_to_run,
+    prepare_input,
+    reload_module,
+    select_solver,
+    time_solver,
+)
+
+POLL_INTERVAL = 0.5
+
+#: Challenge methods tracked individually; everything else in the module is "rest".
+_TRACKED_METHODS = ("parse", "solve_part1", "solve_part2")
+
+
+def section_digests(source: str, class_name: str) -> dict[str, str]:
+    """Digest ``parse``, each ``solve_partN`` and the rest of a solution module separately.
+
+    A change confined to one ``solve_partN`` body only affects that part; a change to
+    ``parse`` or to any other code (helpers, imports, constants) may affect everything.
+    """
+
+    lines = source.splitlines()
+    sections: dict[str, str] = {}
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return {"rest": digest_bytes(source.encode("utf-8"))}
+
+    spans: list[tuple[int, int, str]] = []
+    for node in tree.body:
+        if not (isinstance(node, ast.ClassDef) and node.name == class_name):
+            continue
+        for item in node.body:
+            if isinstance(item, ast.FunctionDef) and item.name in _TRACKED_METHODS:
+                first = min([item.lineno, *(decorator.lineno for decorator in item.decorator_list)])
+                spans.append((first - 1, item.end_lineno, item.name))
+    # Bottom-up, so replacing a span never shifts the line numbers of the ones above it;
+    # one fixed line per method keeps "rest" independent of how long each method is.
+    for start, end, name in sorted(spans, reverse=True):
+        sections[name] = digest_bytes("\n".join(lines[start:end]).encode("utf-8"))
+        lines[start:end] = [f"<{name}>"]
+    sections["rest"] = digest_bytes("\n".join(lines).encode("utf-8"))
+    return sections
+
+
+class WatchSession:
+    """Holds one day's module, challenge and parsed input between reruns.
+
+    ``parse_cache`` and ``gc_mode`` behave as in :func:`~aoc.runner.run_challenge`.
+    """
+
+    def __init__(
+        self,
+        year: int,
+        day: int,
+        *,
+        part: str | None = None,
+        input_path: Path | None = None,
+        parse_cache: ParsedInputCache | None = None,
+        gc_mode: str | None = None,
+    ):
+        self.identity = ChallengeIdentity(year=year, day=day)
+        self.parts = parts_to_run(part)
+        self.input_path = input_path
+        self.parse_cache = parse_cache
+        self.gc_mode = validate_gc_mode(gc_mode) if gc_mode is not None else None
+        self.module: ModuleType = importlib.import_module(challenge_module_name(year, day))
+        self.challenge = self._instantiate()
+        self.sections = self._read_sections()
+        self.module_mtime = _mtime_ns(Path(self.module.__file__))
+        self.input_file = self.challenge.resolve_input_path()
+        self.input_mtime = _mtime_ns(self.input_file)
+        self.input_digest: str | None = None
+        self.data: Any = None
+        self.parse_ms = 0.0
+        self.results: dict[str, PartResult] = {}
+
+    def _instantiate(self) -> BaseChallenge:
+        challenge_cls = _locate_challenge_class(self.module)
+        return challenge_cls(identity=self.identity, input_path=self.input_path)
+
+    def _read_sections(self) -> dict[str, str]:
+        source = Path(self.module.__file__).read_text(encoding="utf-8")
+        return section_digests(source, type(self.challenge).__name__)
+
+    def run_all(self) -> list[PartResult]:
+        self._reparse()
+        return self._solve(self.parts)
+
+    def poll(self) -> tuple[str, list[PartResult]] | None:
+        """Rerun whatever a change since the last poll affects; ``None`` when nothing did."""
+
+        module_mtime = _mtime_ns(Path(self.module.__file__))
+        input_mtime = _mtime_ns(self.input_file)
+        input_changed = input_mtime != self.input_mtime and self._input_digest() != self.input_digest
+        module_changed = module_mtime != self.module_mtime
+        self.module_mtime, self.input_mtime = module_mtime, input_mtime
+        if not (module_changed or input_changed):
+            return None
+
+        reparse = input_changed or self.data is None
+        affected = list(self.parts)
+        if module_changed:
+            self.module = reload_module(self.module)
+            self.challenge = self._instantiate()
+            sections = self._read_sections()
+            if not reparse:
+                reparse = any(
+                    sections.get(name) != self.sections.get(name) for name in ("rest", "parse")
+                )
+            if not reparse:
+                affected = [
+                    part
+                    for part in self.parts
+                    if sections.get(f"solve_part{part}") != self.sections.get(f"solve_part{part}")
+                    or part not in self.results
+                    or self.results[part].status != "ok"
+                ]
+            self.sections = sections
+
+        if reparse:
+            self._reparse()
+            reason = "input changed" if input_changed else "solution changed, re-parsing input"
+        else:
+            reason = "solution changed, reusing parsed input"
+        if not affected:
+            return f"{reason}; no part affected", self._ordered_results(fresh=[])
+        return f"{reason}; rerunning part {', '.join(affected)}", self._solve(affected)
+
+    def _input_digest(self) -> str | None:
+        try:
+            return self.challenge.input_digest()
+        except FileNotFoundError:
+            return None
+
+    def _reparse(self) -> None:
+        self.data = None
+        self.input_digest = self._input_digest()
+        self.data, self.parse_ms = prepare_input(self.challenge, parse_cache=self.parse_cache)
+
+    def _solve(self, parts: list[str]) -> list[PartResult]:
+        # Re-read per solve: a reload may have changed the challenge's own gc_mode.
+        gc_mode = self.gc_mode or validate_gc_mode(self.challenge.gc_mode)
+        for part in parts:
+            monitor = GcMonitor(gc_mode)
+            monitor.start()
+            try:
+                answer, duration_ms = time_solver(select_solver(self.challenge, part), self.data)
+            except Exception as exc:  # noqa: BLE001 - keep watching after a failing solver
+                monitor.stop()
+                traceback.print_exc()
+                error = traceback.format_exception_only(type(exc), exc)[-1].strip()
+                result = PartResult(part=part, answer="", duration_ms=0.0, status="error", error=error)
+            else:
+                gc_usage = monitor.stop()
+                result = PartResult(
+                    part=part,
+                    answer=answer,
+                    duration_ms=duration_ms,
+                    parse_ms=self.parse_ms,
+                    gc_mode=gc_mode,
+                    gc_collections=gc_usage.collections,
+                    gc_ms=gc_usage.gc_ms,
+                )
+            self.results[part] = result
+        return self._ordered_results(fresh=parts)
+
+    def _ordered_results(self, fresh: list[str]) -> list[PartResult]:
+        results: list[PartResult] = []
+        for part in self.parts:
+            result = self.results.get(part)
+            if result is None:
+                continue
+            if part not in fresh and result.status == "ok":
+                # Shown like a cache hit: the answer was reused, not recomputed.
+                result = PartResult(
+                    part=part,
+                    answer=result.answer,
+                    duration_ms=result.duration_ms,
+                    parse_ms=result.parse_ms,
+                    cached=True,
+                )
+            results.append(result)
+        return results
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def watch(
+    year: int,
+    day: int,
+    *,
+    part: str | None = None,
+    input_path: Path | None = None,
+    parse_cache: ParsedInputCache | None = None,
+    gc_mode: str | None = None,
+    interval: float = POLL_INTERVAL,
+) -> None:
+    """Run the day once, then poll its module and input and rerun until interrupted."""
+
+    session = WatchSession(
+        year, day, part=part, input_path=input_path, parse_cache=parse_cache, gc_mode=gc_mode
+    )
+    print(f"Watching {session.module.__file__} and {session.input_file} (Ctrl-C to stop)")
+    _report(session.run_all)
+    try:
+        while True:
+            time.sleep(interval)
+            _report(session.poll)
+    except KeyboardInterrupt:
+        pass
+
+
+def _report(step: Callable[[], Any]) -> None:
+    try:
+        outcome = step()
+    except Exception:  # noqa: BLE001 - a broken edit should not end the session
+        traceback.print_exc()
+        print(f"[{time.strftime('%H:%M:%S')}] waiting for the next change", file=sys.stderr)
+        return
+    if outcome is None:
+        return
+    if isinstance(outcome, tuple):
+        reason, results = outcome
+        print(f"\n[{time.strftime('%H:%M:%S')}] {reason}")
+    else:
+        results = outcome
+    print(format_results(results))
@@ -0,0 +1,124 @@
+"""Seeded synthetic inputs for the 2025 puzzles, used by ``aoc bench --scale``.
+
+``n`` is the natural record count of each puzzle (moves, ranges, banks, points,
+machines) or the approximate number of cells for grid puzzles. Days 11 and 12
+have no generator: their search spaces grow exponentially, not with ``n``.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from collections.abc import Iterator
+
+from aoc.gen import register
+
+_BATCH = 4096
+
+
+@register(2025, 1)
+def day01(n: int, rng: random.Random) -> Iterator[str]:
+    batch: list[str] = []
+    for _ in range(n):
+        batch.append(f"{rng.choice('LR')}{rng.randint(1, 999)}\n")
+        if len(batch) == _BATCH:
+            yield "".join(batch)
+            batch.clear()
+    yield "".join(batch)
+
+
+@register(2025, 2)
+def day02(n: int, rng: random.Random) -> Iterator[str]:
+    ranges: list[str] = []
+    for _ in range(n):
+        start = rng.randint(10, 10**10)
+        ranges.append(f"{start}-{start + rng.randint(0, 5_000)}")
+    yield ",".join(ranges) + "\n"
+
+
+@register(2025, 3)
+def day03(n: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(n):
+        yield "".join(rng.choices("123456789", k=100)) + "\n"
+
+
+@register(2025, 4)
+def day04(n: int, rng: random.Random) -> Iterator[str]:
+    side = max(1, math.isqrt(n))
+    for _ in range(side):
+        yield "".join("@" if rng.random() < 0.6 else "." for _ in range(side)) + "\n"
+
+
+@register(2025, 5)
+def day05(n: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(n):
+        start = rng.randint(1, 10**15)
+        yield f"{start}-{start + rng.randint(0, 10**12)}\n"
+    yield "\n"
+    for _ in range(n):
+        yield f"{rng.randint(1, 10**15)}\n"
+
+
+@register(2025, 6)
+def day06(n: int, rng: random.Random) -> Iterator[str]:
+    rows: list[list[str]] = [[] for _ in range(4)]
+    ops: list[str] = []
+    for _ in range(n):
+        numbers = [str(rng.randint(1, 9999)) for _ in range(4)]
+        width = max(map(len, numbers))
+        for row, number in zip(rows, numbers):
+            row.append(number.ljust(width) if rng.random() < 0.5 else number.rjust(width))
+        ops.append(rng.choice("+*").ljust(width))
+    for row in rows:
+        yield " ".join(row) + "\n"
+    yield " ".join(ops) + "\n"
+
+
+@register(2025, 7)
+def day07(n: int, rng: random.Random) -> Iterator[str]:
+    side = max(3, math.isqrt(n))
+    yield "." * (side // 2) + "S" + "." * (side - side // 2 - 1) + "\n"
+    for row in range(1, side):
+        if row % 2:
+            yield "." * side + "\n"
+        else:
+            # like the real input, splitters never sit side by side (Day07 relies on it)
+            cells = ["."] * side
+            for col in range(side):
+                if (col == 0 or cells[col - 1] == ".") and rng.random() < 0.15:
+                    cells[col] = "^"
+            yield "".join(cells) + "\n"
+
+
+@register(2025, 8)
+def day08(n: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(n):
+        yield f"{rng.randint(0, 99_999)},{rng.randint(0, 99_999)},{rng.randint(0, 99_999)}\n"
+
+
+@register(2025, 9)
+def day09(n: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(n):
+        yield f"{rng.randint(0, 99_999)},{rng.randint(0, 99_999)}\n"
+
+
+@register(2025, 10)
+def day10(n: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(n):
+        lights = rng.randint(4, 8)
+        buttons = [
+            sorted(rng.sample(range(lights), rng.randint(1, lights)))
+            for _ in range(rng.randint(3, 7))
+        ]
+        # XOR of a random non-empty subset keeps every machine solvable.
+        target = [False] * lights
+        for button in rng.sample(buttons, rng.randint(1, len(buttons))):
+            for light in button:
+                target[light] = not target[light]
+        if not any(target):
+            target[buttons[0][0]] = True
+            buttons.append([buttons[0][0]])
+        diagram = "".join("#" if light else "." for light in target)
+        wiring = " ".join("(" + ",".join(map(str, button)) + ")" for button in buttons)
+        joltage = ",".join(str(rng.randint(1, 99)) for _ in range(lights))
+        yield f"[{diagram}] {wiring} {{{joltage}}}\n"
@@ -2,42 +2,75 @@
 
 from __future__ import annotations
 
-from aoc.base import BaseChallenge, ChallengeIdentity
+from itertools import accumulate, pairwise
+
+from aoc._compat import numpy
+from aoc.base import BaseChallenge, ChallengeIdentity, InputStream
+from aoc.parsing import ints, ints_numpy
+
+DIAL_SIZE = 100
+START = 50
+
+
+def _spin_numpy(deltas, loc: int) -> tuple[int, int, int]:
+    # unwrapped positions before and after every move: loc, loc + m1, loc + m1 + m2, ...
+    positions = numpy.empty(len(deltas) + 1, dtype=numpy.int64)
+    positions[0] = loc
+    numpy.cumsum(deltas, out=positions[1:])
+    positions[1:] += loc
+    turns = positions // DIAL_SIZE
+    zero = positions == turns * DIAL_SIZE
+    landings = int(numpy.count_nonzero(zero[1:]))
+    # a move passes 0 once per full turn it crosses; a left move starting on 0
+    # does not pass it again, while one ending on 0 does (see _spin_python)
+    left = deltas < 0
+    passes = (
+        int(numpy.abs(numpy.diff(turns)).sum())
+        + int(numpy.count_nonzero(zero[1:] & left))
+        - int(numpy.count_nonzero(zero[:-1] & left))
+    )
+    return int(positions[-1] % DIAL_SIZE), landings, passes
+
+
+def _spin_python(moves, loc: int) -> tuple[int, int, int]:
+    # a right move passes 0 once per multiple of 100 in (before, after],
+    # a left move once per multiple in [after, before)
+    landings = passes = 0
+    for before, after in pairwise(accumulate(moves, initial=loc)):
+        if after > before:
+            passes += after // DIAL_SIZE - before // DIAL_SIZE
+        else:
+            passes += (before - 1) // DIAL_SIZE - (after - 1) // DIAL_SIZE
+        if after % DIAL_SIZE == 0:
+            landings += 1
+    return (loc + sum(moves)) % DIAL_SIZE, landings, passes
 
 
 class Day01(BaseChallenge):
     identity = ChallengeIdentity(year=2025, day=1)
+    input_mode = "stream"
 
     @staticmethod
-    def _parse_moves(data: list[str]) -> list[tuple[str, int]]:
-        moves: list[tuple[str, int]] = []
-        for line in data:
-            line = line.strip()
-            if not line:
-                continue
-            direction = line[0]
-            distance = int(line[1:])
-            if direction not in {"L", "R"}:
-                continue
-            moves.append((direction, distance))
-        return moves
-
-    def solve_part1(self, data: list[str]) -> str:
-        loc = 50
-        zeroCnt = 0
-        for direction, distance in self._parse_moves(data):
-            if direction == "L":
-                loc = (loc - distance) % 100
-            else:
-                loc = (loc + distance) % 100
-                
-            if (loc == 0): zeroCnt+=1
-            
+    def _spin(stream: InputStream) -> tuple[int, int, int]:
+        # final dial position, moves that end on 0 and clicks that point at 0;
+        # each streamed chunk becomes one batch of signed deltas (L68 -> -68, R48 -> 48)
+        parse, spin = (ints, _spin_python) if numpy is None else (ints_numpy, _spin_numpy)
+        loc, landings, passes = START, 0, 0
+        for chunk in stream.chunks():
+            moves = parse(chunk, negative=b"L")
+            if len(moves):
+                loc, chunk_landings, chunk_passes = spin(moves, loc)
+                landings += chunk_landings
+                passes += chunk_passes
+        return loc, landings, passes
+
+    def solve_part1(self, data: InputStream) -> str:
+        loc, zeroCnt, _ = self._spin(data)
         return f"Final loc: {loc}, final counter: {zeroCnt}"
 
-    def solve_part2(self, data: list[str]) -> str:
-        # TODO: implement part 2
-        return "not implemented"
+    def solve_part2(self, data: InputStream) -> str:
+        loc, _, zeroCnt = self._spin(data)
+        return f"Final loc: {loc}, final counter: {zeroCnt}"
 
 
 Challenge = Day01
@@ -2,57 +2,88 @@
 
 from __future__ import annotations
 
-from aoc.base import BaseChallenge, ChallengeIdentity
+from itertools import combinations
+from math import prod
+
+from aoc.base import BaseChallenge, ChallengeIdentity, RawInput
+from aoc.parsing import records
+
+
+def _prime_factors(n: int) -> list[int]:
+    factors, p = [], 2
+    while p * p <= n:
+        if n % p == 0:
+            factors.append(p)
+            while n % p == 0:
+                n //= p
+        p += 1
+    if n > 1:
+        factors.append(n)
+    return factors
+
+
+def _repeats_in(lo: int, hi: int, block_len: int, repeats: int) -> tuple[int, int]:
+    # every block_len-digit block B repeated `repeats` times is B * 100..0100..01,
+    # so the matches in [lo, hi] are an arithmetic series of blocks: count and sum it
+    factor = (10 ** (block_len * repeats) - 1) // (10**block_len - 1)
+    first = max(10 ** (block_len - 1), -(-lo // factor))
+    last = min(10**block_len - 1, hi // factor)
+    if first > last:
+        return 0, 0
+    count = last - first + 1
+    return count, factor * (first + last) * count // 2
+
+
+def countRepeatedIds(start: int, end: int, *, only_halves: bool) -> tuple[int, int]:
+    """Count and sum the IDs in ``start..end`` made of one block repeated (exactly twice
+    with ``only_halves``, otherwise at least twice), without visiting the range."""
+
+    count = total = 0
+    for digits in range(len(str(max(start, 1))), len(str(end)) + 1):
+        lo, hi = max(start, 10 ** (digits - 1)), min(end, 10**digits - 1)
+        if lo > hi:
+            continue
+        if only_halves:
+            if digits % 2 == 0:
+                found, found_sum = _repeats_in(lo, hi, digits // 2, 2)
+                count, total = count + found, total + found_sum
+            continue
+        # an ID repeats a block if its period is digits / p for some prime p dividing
+        # digits; a block of length digits / (p*q) is counted for both p and q, so
+        # add and subtract over every set of primes (inclusion-exclusion)
+        primes = _prime_factors(digits)
+        for size in range(1, len(primes) + 1):
+            sign = 1 if size % 2 else -1
+            for chosen in combinations(primes, size):
+                repeats = prod(chosen)
+                found, found_sum = _repeats_in(lo, hi, digits // repeats, repeats)
+                count, total = count + sign * found, total + sign * found_sum
+    return count, total
 
 
 class Day02(BaseChallenge):
     identity = ChallengeIdentity(year=2025, day=2)
-    
-    @staticmethod
-    def _parse_ranges(data: list[str]) -> list[tuple[int, int]]:
-        ranges: list[tuple[int, int]] = []
-        for line in data:
-            line = line.strip()
-            if not line:
-                continue
-            parts = line.split(",")
-            for part in parts:
-                bounds = part.split("-")
-                if len(bounds) != 2:
-                    continue
-                start, end = int(bounds[0]), int(bounds[1])
-                ranges.append((start, end))
-        return ranges
-    
-    @staticmethod
-    def findInvalidIdsInRange(range_tuple: tuple[int, int]) -> list[int]:
-        start, end = range_tuple
-        invalid_ids = []
-        for num in range(start, end + 1):
-            str_num = str(num)
-            len_num = len(str_num)
-            # if the length of the id is an even number, it's skipped
-            if len_num % 2 != 0:
-                continue
-            # if the first half of the digits is equal to the second half, it's invalid
-            mid = len_num // 2
-            # print(f"Checking ID {num}, len {len_num}, mid {mid}, first half {str_num[:mid]}, second half {str_num[mid:]}")
-            if str_num[:mid] == str_num[mid:]:
-                invalid_ids.append(num)    
-        
-        return invalid_ids
-    
-    def solve_part1(self, data: list[str]) -> str:
-        ranges = self._parse_ranges(data)
-        invalid_ids = []
-        for range_tuple in ranges:
-            invalid_ids.extend(self.findInvalidIdsInRange(range_tuple))
-        ids_arr = str(len(invalid_ids))
-        return f"{ids_arr} invalid IDs found: {invalid_ids}, with sum {sum(invalid_ids)}"
-
-    def solve_part2(self, data: list[str]) -> str:
-        # TODO: implement part 2
-        return "not implemented"
+    input_mode = "raw"
+
+    def parse(self, data: RawInput) -> list[tuple[int, int]]:
+        # "start-end,start-end,...": the "-" is a separator, not a sign
+        return records(data, 2, signed=False)
+
+    def solve_part1(self, data: list[tuple[int, int]]) -> str:
+        # invalid: the first half of the digits equals the second half
+        count = total = 0
+        for start, end in data:
+            found, found_sum = countRepeatedIds(start, end, only_halves=True)
+            count, total = count + found, total + found_sum
+        return f"{count} invalid IDs found, with sum {total}"
+
+    def solve_part2(self, data: list[tuple[int, int]]) -> str:
+        # invalid: some block of digits repeated two or more times
+        count = total = 0
+        for start, end in data:
+            found, found_sum = countRepeatedIds(start, end, only_halves=False)
+            count, total = count + found, total + found_sum
+        return f"{count} invalid IDs found, with sum {total}"
 
 
 Challenge = Day02
@@ -2,40 +2,41 @@
 
 from __future__ import annotations
 
-from aoc.base import BaseChallenge, ChallengeIdentity
+from aoc.base import BaseChallenge, ChallengeIdentity, RawInput
+
+
+def maxJoltage(bank: bytes, k: int) -> int:
+    """Largest number formed by ``k`` digits of ``bank`` kept in their original order."""
+
+    # monotonic stack over the digit bytes: a smaller digit is dropped as soon as a
+    # bigger one follows, while enough digits remain to still pick k of them
+    drops = len(bank) - k
+    if drops < 0:
+        raise ValueError(f"Bank {bytes(bank)!r} has fewer than {k} batteries.")
+    stack = bytearray()
+    for digit in bank:
+        while drops and stack and stack[-1] < digit:
+            stack.pop()
+            drops -= 1
+        stack.append(digit)
+    # ASCII digits compare like their values, so the kept bytes parse directly
+    return int(stack[:k])
 
 
 class Day03(BaseChallenge):
     identity = ChallengeIdentity(year=2025, day=3)
+    input_mode = "raw"
 
-    def solve_part1(self, data: list[str]) -> str:
-        maxList: list[int] = []
-        for line in data:
-            line = line.strip()
-            if not line:
-                continue
-            
-            max1 = 0
-            max2 = None
-            # find two largest numbers (chars), max 1 can nopt be the last number in the line
-            for i in range(len(line) - 1):
-                num = int(line[i])
-                if num > max1:
-                    max2 = None # because max2 is only after max1
-                    max1 = num
-                elif max2 is None or num > max2:
-                    max2 = num
-            
-            if max2 is None or max2 < int(line[-1]):
-                max2 = int(line[-1]) # last number if max2 wasnt set or max1 found as before-last number or max2 is less than last number
-                
-            maxList.append(max1*10 + max2)
-            
+    def parse(self, data: RawInput) -> list[bytes]:
+        return data.data[:].split()
+
+    def solve_part1(self, data: list[bytes]) -> str:
+        maxList = [maxJoltage(bank, 2) for bank in data]
         return f"MaxList: {maxList}, Total Sum: {sum(maxList)}"
 
-    def solve_part2(self, data: list[str]) -> str:
-        # TODO: implement part 2
-        return "not implemented"
+    def solve_part2(self, data: list[bytes]) -> str:
+        maxList = [maxJoltage(bank, 12) for bank in data]
+        return f"MaxList: {maxList}, Total Sum: {sum(maxList)}"
 
 
 Challenge = Day03
@@ -2,54 +2,30 @@
 
 from __future__ import annotations
 
-from aoc.base import BaseChallenge, ChallengeIdentity
+from aoc.base import BaseChallenge, ChallengeIdentity, RawInput
+from aoc.grid import Grid
 
 
 class Day04(BaseChallenge):
     identity = ChallengeIdentity(year=2025, day=4)
+    input_mode = "raw"
+
+    def parse(self, data: RawInput) -> Grid:
+        return Grid.from_raw(data)
+
+    def solve_part1(self, data: Grid) -> str:
+        # a roll is accessible when fewer than 4 of its 8 neighbours are rolls too;
+        # count every cell's roll neighbours at once instead of peeking at adjacent lines
+        rolls = data.mask(b"@")
+        crowded = data.at_least(data.neighbor_counts(rolls), 4)
+        accessableRolls = data.count(rolls & ~crowded)
 
-    def solve_part1(self, data: list[str]) -> str:
-        accessableRolls = 0
-        # for each line we need to also look at the previous and next lines as well
-        for index, line in enumerate(data):
-            line = line.strip()
-            prev_line = None
-            next_line = None
-            if not line:
-                continue
-            if (index > 0):
-                prev_line = data[index - 1].strip()
-            else:
-                prev_line = None
-            if (index < len(data) - 1):
-                next_line = data[index + 1].strip()
-            else:
-                next_line = None
-                
-            # print(f"Processing line {index}: {line}, prev: {prev_line}, next: {next_line}")
-            for char_index, char in enumerate(line):
-                if char == '@':
-                    neighborsCount = 0
-                    for i in range(char_index - 1, char_index + 2):
-                        if i < 0 or i >= len(line):
-                            continue
-                        if prev_line and prev_line[i] == '@':
-                            # print(f"Found neighbor above at index {i} for char index {char_index}")
-                            neighborsCount += 1
-                        if next_line and next_line[i] == '@':
-                            # print(f"Found neighbor below at index {i} for char index {char_index}")
-                            neighborsCount += 1
-                        if char_index != i and line[i] == '@':
-                            # print(f"Found neighbor side at index {i} for char index {char_index}")
-                            neighborsCount += 1
-                    if neighborsCount < 4:
-                        accessableRolls += 1
-        
         return f"Accessable Rolls: {accessableRolls}"
 
-    def solve_part2(self, data: list[str]) -> str:
-        # TODO: implement part 2
-        return "not implemented"
+    def solve_part2(self, data: Grid) -> str:
+        # removing accessible rolls can make their neighbours accessible: peel until stable
+        removedPerRound = data.peel(data.mask(b"@"), 4)
+        return f"Removed Rolls: {sum(removedPerRound)}, per round: {removedPerRound}"
 
 
 Challenge = Day04
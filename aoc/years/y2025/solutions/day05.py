@@ -2,42 +2,76 @@
 
 from __future__ import annotations
 
-from aoc.base import BaseChallenge, ChallengeIdentity
+import re
+from array import array
+from collections.abc import Iterator
+from typing import Any
+
+from aoc._compat import numpy
+from aoc.base import BaseChallenge, ChallengeIdentity, InputStream
+from aoc.intervals import IntervalSet
+from aoc.parsing import ints, ints_numpy
+
+# the separator is a blank line, which may still hold spaces or a CRLF "\r"
+_SEPARATOR = re.compile(rb"^[ \t\r]*\n", re.MULTILINE)
 
 
 class Day05(BaseChallenge):
     identity = ChallengeIdentity(year=2025, day=5)
+    # the ranges are small and kept in memory, the ingredient ids are streamed
+    input_mode = "stream"
 
-    def solve_part1(self, data: list[str]) -> str:
-        # first we "collect" all the fresh ingredients in one bool list
-        freshIngredientsRanges: list[tuple[int, int]] = []
-        lastRangesIndex = 0
-        freshIngredientsCount = 0 
-        for index, line in enumerate(data):
-            line = line.strip()
-            if not line:
-                lastRangesIndex = index
-                break # stop at empty line (separates fresh-ranges from available ingredients)
-            
-            start, stop = line.split('-')
-            freshIngredientsRanges.append((int(start), int(stop)))
-                
-        for line in data[lastRangesIndex+1:]:
-            line = line.strip()
-            if not line:
+    def parse(self, lines: InputStream) -> tuple[IntervalSet, InputStream]:
+        # first we "collect" all the fresh ingredients ranges, chunk by chunk up to the
+        # empty line (separates fresh-ranges from available ingredients);
+        # "start-stop" per line: the "-" is a separator, not a sign
+        parse = ints if numpy is None else ints_numpy
+        batches = []
+        for chunk in lines.chunks():
+            # chunks start on a line boundary, so "^" finds the separator in any of them
+            separator = _SEPARATOR.search(chunk)
+            if separator is None:
+                batches.append(parse(chunk, signed=False))
                 continue
-            
-            for rangeStart, rangeEnd in freshIngredientsRanges:
-                ingredient = int(line)
-                if rangeStart <= ingredient <= rangeEnd:
-                    freshIngredientsCount += 1
-                    break # found in one of the ranges, no need to check further
-                
+            batches.append(parse(chunk[: separator.start()], signed=False))
+            break
+        if numpy is None:
+            bounds = array("q")
+            for batch in batches:
+                bounds.extend(batch)
+        else:
+            bounds = numpy.concatenate(batches) if batches else numpy.zeros(0, dtype=numpy.int64)
+        if len(bounds) % 2:
+            raise ValueError("Every fresh ingredients range needs a start and an end.")
+        # sorted and merged once, so every lookup is a binary search
+        freshIngredients = IntervalSet.from_arrays(bounds[0::2], bounds[1::2])
+        return freshIngredients, lines
+
+    def _iter_ingredients(self, lines: InputStream) -> Iterator[Any]:
+        # one batch of ids per chunk, as a NumPy array when available
+        parse = ints if numpy is None else ints_numpy
+        inRanges = True
+        for chunk in lines.chunks():
+            if inRanges:
+                separator = _SEPARATOR.search(chunk)
+                if separator is None:
+                    continue # still in the ranges section
+                chunk = chunk[separator.end() :]
+                inRanges = False
+            yield parse(chunk, signed=False)
+
+    def solve_part1(self, data: tuple[IntervalSet, InputStream]) -> str:
+        freshIngredients, lines = data
+        freshIngredientsCount = 0
+        for ingredients in self._iter_ingredients(lines):
+            freshIngredientsCount += freshIngredients.count_members(ingredients)
+
         return f"Fresh Ingredients Count: {freshIngredientsCount}"
 
-    def solve_part2(self, data: list[str]) -> str:
-        # TODO: implement part 2
-        return "not implemented"
+    def solve_part2(self, data: tuple[IntervalSet, InputStream]) -> str:
+        freshIngredients, _ = data
+        # every id inside any range, overlaps counted once
+        return f"Fresh Ingredient IDs: {freshIngredients.covered()}"
 
 
 Challenge = Day05
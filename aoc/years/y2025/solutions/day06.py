@@ -2,17 +2,19 @@
 
 from __future__ import annotations
 
-from aoc.base import BaseChallenge, ChallengeIdentity
+from aoc.base import BaseChallenge, ChallengeIdentity, RawInput
 
 
 class Day06(BaseChallenge):
     identity = ChallengeIdentity(year=2025, day=6)
+    # A handful of very wide rows: split them as bytes instead of decoding each one.
+    input_mode = "raw"
 
-    def solve_part1(self, data: list[str]) -> str:
-        numsAndOps: dict[int, list[str]] = {}
+    def solve_part1(self, data: RawInput) -> str:
+        numsAndOps: dict[int, list[bytes]] = {}
         finalSum = 0
-        for line in data:
-            line = line.strip()
+        for line in data.iter_bytes():
+            line = bytes(line).strip()
             if not line:
                 continue
             
@@ -33,9 +35,9 @@ class Day06(BaseChallenge):
             operation = elements[opIndex]
             numbers = [int(e) for i, e in enumerate(elements) if i != opIndex]
             
-            if operation == "+":
+            if operation == b"+":
                 finalSum += sum(numbers)
-            elif operation == "*":
+            elif operation == b"*":
                 product = 1
                 for n in numbers:
                     product *= n
@@ -44,7 +46,7 @@ class Day06(BaseChallenge):
                 continue
         return str(finalSum)
 
-    def solve_part2(self, data: list[str]) -> str:
+    def solve_part2(self, data: RawInput) -> str:
         # TODO: implement part 2
         return "not implemented"
 
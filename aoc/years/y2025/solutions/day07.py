@@ -2,38 +2,38 @@
 
 from __future__ import annotations
 
-from aoc.base import BaseChallenge, ChallengeIdentity
+from aoc.base import BaseChallenge, ChallengeIdentity, RawInput
+from aoc.grid import Grid
 
 
 class Day07(BaseChallenge):
     identity = ChallengeIdentity(year=2025, day=7)
-
-    def solve_part1(self, data: list[str]) -> str:
-        splittersDict: dict[int, bool] = {}
+    input_mode = "raw"
+
+    def parse(self, data: RawInput) -> Grid:
+        return Grid.from_raw(data)
+
+    def solve_part1(self, data: Grid) -> str:
+        start = data.find(b"S")
+        if start is None:
+            return "Splitscount: 0"
+        row, col = start
+        # bit i of beams is set while a beam travels down column i
+        beams = 1 << col
+        inside = (1 << data.width) - 1
         splitsCount = 0
-        
-        for line in data:
-            line = line.strip()
-            if not line:
-                continue
-            
-            for index, char in enumerate(line):
-                if char == "S":
-                    # starter
-                    splittersDict[index] = True
-                    continue # safely continue, we know S is only at the start
-                if char == "^" and splittersDict.get(index, False):
-                    # valid splitter
-                    splitsCount += 1
-                    if index - 1 >= 0:
-                        splittersDict[index - 1] = True
-                    if index + 1 < len(line):
-                        splittersDict[index + 1] = True
-                    splittersDict[index] = False
-        
+
+        # every beam that meets a splitter stops and continues left and right of it;
+        # splitters never sit side by side, so a whole row splits in one step
+        for splitters in data.row_masks(b"^", start=row + 1):
+            hit = beams & splitters
+            if hit:
+                splitsCount += hit.bit_count()
+                beams = ((beams & ~hit) | hit << 1 | hit >> 1) & inside
+
         return f"Splitscount: {splitsCount}"
 
-    def solve_part2(self, data: list[str]) -> str:
+    def solve_part2(self, data: Grid) -> str:
         # TODO: implement part 2
         return "not implemented"
 
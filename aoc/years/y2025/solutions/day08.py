@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
-from aoc.base import BaseChallenge, ChallengeIdentity
+from aoc.base import BaseChallenge, ChallengeIdentity, RawInput
+from aoc.parsing import records
 
 
 class Day08(BaseChallenge):
     identity = ChallengeIdentity(year=2025, day=8)
+    input_mode = "raw"
+    # the ~500k pair distances are all kept alive, so cyclic collections only waste time
+    gc_mode = "off"
     
     def get3Ddistance (self, point1: tuple[int, int, int], point2: tuple[int, int, int]) -> float:
         x1, y1, z1 = point1
@@ -14,20 +18,16 @@ class Day08(BaseChallenge):
         return ((x2 - x1) ** 2 + (y2 - y1) ** 2 + (z2 - z1) ** 2) ** 0.5
 
 
-    def solve_part1(self, data: list[str]) -> str:
+    def parse(self, data: RawInput) -> list[tuple[int, int, int]]:
+        # one "x,y,z" point per line
+        return records(data, 3)
+
+    def solve_part1(self, data: list[tuple[int, int, int]]) -> str:
         """might be a bit more complex than an optimal solution... 
         kinda bruteforced it, it is midnight after all"""
         
         # we need to compute the n shortest paths between all points in 3D space
-        points: list[tuple[int, int, int]] = []
-        for line in data:
-            line = line.strip()
-            if not line:
-                continue
-            
-            xStr, yStr, zStr = line.split(",")
-            point = (int(xStr), int(yStr), int(zStr))
-            points.append(point)
+        points = data
             
         """this will hold a mapping of the index of 2 points to their distance"""    
         pointsToDistances: dict[tuple[int, int], float] = {}
@@ -105,7 +105,7 @@ class Day08(BaseChallenge):
             
         return str(result)
 
-    def solve_part2(self, data: list[str]) -> str:
+    def solve_part2(self, data: list[tuple[int, int, int]]) -> str:
         # TODO: implement part 2
         return "not implemented"
 
@@ -2,23 +2,20 @@
 
 from __future__ import annotations
 
-from aoc.base import BaseChallenge, ChallengeIdentity
+from aoc.base import BaseChallenge, ChallengeIdentity, RawInput
+from aoc.parsing import records
 
 
 class Day09(BaseChallenge):
     identity = ChallengeIdentity(year=2025, day=9)
+    input_mode = "raw"
 
-    def solve_part1(self, data: list[str]) -> str:
-        # read the coordinates of points in 2D space from the input data
-        points: list[tuple[int, int]] = []
-        for line in data:
-            line = line.strip()
-            if not line:
-                continue
-
-            xStr, yStr = line.split(",")
-            point = (int(xStr), int(yStr))
-            points.append(point)
+    def parse(self, data: RawInput) -> list[tuple[int, int]]:
+        # read the coordinates of points in 2D space from the input data, one "x,y" per line
+        return records(data, 2)
+
+    def solve_part1(self, data: list[tuple[int, int]]) -> str:
+        points = data
             
         #  for every pair of points that are not aligned either horizontally or vertically,
         #  compute the area of the rectangle if they were the opposite corners
@@ -36,7 +33,7 @@ class Day09(BaseChallenge):
                         
         return str(currentMaxArea)
 
-    def solve_part2(self, data: list[str]) -> str:
+    def solve_part2(self, data: list[tuple[int, int]]) -> str:
         # TODO: implement part 2
         return "not implemented"
 
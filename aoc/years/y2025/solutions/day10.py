@@ -1,36 +1,38 @@
 """Day 10: Description TBD."""
 
 from __future__ import annotations
+import re
 from itertools import combinations
 
-from aoc.base import BaseChallenge, ChallengeIdentity
+from aoc.base import BaseChallenge, ChallengeIdentity, RawInput
+
+# [diagram] followed by the (button) groups; the {joltage} block is not captured
+_MACHINE = re.compile(rb"\[([.#]*)\]([^{\n]*)")
+_BUTTON = re.compile(rb"\(([\d,]*)\)")
 
 
 class Day10(BaseChallenge):
     identity = ChallengeIdentity(year=2025, day=10)
+    input_mode = "raw"
 
-    def solve_part1(self, data: list[str]) -> str:
+    def parse(self, data: RawInput) -> list[tuple[str, list[set[int]]]]:
         machines: list[tuple[str, list[set[int]]]] = []
         # Each line contains a single indicator light diagram in [square brackets], 
         # one or more button wiring schematics in (parentheses), 
         # and joltage requirements in {curly braces}, which we can ignore for the first part
         # Example line: [.##.] (3) (1,3) (2) (2,3) (0,2) (0,1) {3,5,4,7}
         
-        # read each line of input data
-        for line in data:
-            if not line.strip():
-                continue
-            light_diagram = line[line.index('[')+1:line.index(']')]
-            button_schematics = []
-            start = line.index(']') + 1
-            while '(' in line[start:]:
-                open_paren = line.index('(', start)
-                close_paren = line.index(')', open_paren)
-                button_schematics.append(set(map(int, line[open_paren+1:close_paren].split(','))))
-                start = close_paren + 1
+        # one regex pass over the whole input finds every machine
+        for diagram, wiring in _MACHINE.findall(data.data):
+            button_schematics = [
+                set(map(int, button.split(b','))) for button in _BUTTON.findall(wiring)
+            ]
             # requirements are ignored for part 1
-            machines.append((light_diagram, button_schematics))
-                
+            machines.append((diagram.decode(), button_schematics))
+        return machines
+
+    def solve_part1(self, data: list[tuple[str, list[set[int]]]]) -> str:
+        machines = data
         # print(f"Starting schematics: {requirementsToButtonsAndStartingSchematics}")
         # now we have starting schematics, we can try to find the minimum button presses
         # start by pressing one button from the starting schematics for each line (light diagram), 
@@ -101,7 +103,7 @@ class Day10(BaseChallenge):
                 
         return str(currentTotalPresses)
 
-    def solve_part2(self, data: list[str]) -> str:
+    def solve_part2(self, data: list[tuple[str, list[set[int]]]]) -> str:
         # TODO: implement part 2
         return "not implemented"
 
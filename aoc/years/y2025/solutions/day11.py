@@ -8,16 +8,20 @@ from aoc.base import BaseChallenge, ChallengeIdentity
 class Day11(BaseChallenge):
     identity = ChallengeIdentity(year=2025, day=11)
 
-    def solve_part1(self, data: list[str]) -> str:
+    def parse(self, lines: list[str]) -> dict[str, list[str]]:
         sourceToDeste: dict[str, list[str]] = {}
         
-        for line in data:
+        for line in lines:
             if not line.strip():
                 continue
             parts = line.split(": ")
             source = parts[0].strip()
             dests = [dest.strip() for dest in parts[1].split()]
             sourceToDeste[source] = dests
+        return sourceToDeste
+
+    def solve_part1(self, data: dict[str, list[str]]) -> str:
+        sourceToDeste = data
         
         # print(f"Source to destinations mapping: {sourceToDeste}")    
         # we need to find all unique paths from 'you' to 'out', so we can use DFS or BFS
@@ -40,7 +44,7 @@ class Day11(BaseChallenge):
         
         return str("Finished calculating: " + str(len(finishedPaths)))
 
-    def solve_part2(self, data: list[str]) -> str:
+    def solve_part2(self, data: dict[str, list[str]]) -> str:
         # TODO: implement part 2
         return "not implemented"
 
@@ -236,7 +236,10 @@ def _can_fit_region(
 class Day12(BaseChallenge):
     identity = ChallengeIdentity(year=2025, day=12)
 
-    def solve_part1(self, data: list[str]) -> str:
+    def parse(self, lines: list[str]) -> tuple[list[list[str]], list[tuple[int, int, list[int]]]]:
+        return _parse_input(lines)
+
+    def solve_part1(self, data: tuple[list[list[str]], list[tuple[int, int, list[int]]]]) -> str:
         # each shape starts with its index and a colon; then, 
         # the shape is displayed visually, in a 2D grid,
         # where # is part of the shape and . is not.
@@ -249,51 +252,6 @@ class Day12(BaseChallenge):
         # of each shape of present; 1 0 1 0 3 2 means you need 
         # to fit one present with shape index 0, no presents with 
         # shape index 1, one present with shape index 2, etc.
-        shapes: dict[int, list[str]] = {}
-        regions: list[tuple[int, int, list[int]]] = []
-        currentShapeIndex: int | None = None
-        currentShapeLines: list[str] = []
-        previousLineWasSpace: bool = False
-        parsingRegions: bool = False
-        
-        for line in data:
-            if not line.strip():
-                previousLineWasSpace = True
-                continue
-            if line.endswith(":"):
-                # new shape starts
-                if currentShapeIndex is not None:
-                    shapes[currentShapeIndex] = currentShapeLines
-                currentShapeIndex = int(line[:-1])
-                currentShapeLines = []
-                previousLineWasSpace = False
-            else:
-                if previousLineWasSpace:
-                    # here the regions are listed; stop parsing shapes
-                    if currentShapeIndex is not None:
-                        shapes[currentShapeIndex] = currentShapeLines
-                    currentShapeIndex = None
-                    currentShapeLines = []
-                    parsingRegions = True
-                    previousLineWasSpace = False
-                if parsingRegions:
-                    # parse region line
-                    parts = line.split()
-                    dimensions = parts[0].split('x')
-                    width = int(dimensions[0])
-                    length = int(dimensions[1].strip(":"))
-                    shapeCounts = list(map(int, parts[1:]))
-                    regions.append((width, length, shapeCounts))
-                else:
-                    # continue parsing current shape
-                    currentShapeLines.append(line.strip())
-                
-            if currentShapeIndex is not None:
-                shapes[currentShapeIndex] = currentShapeLines    
-                        
-        # print(f"Parsed shapes: {shapes}")
-        # print(f"Parsed regions: {regions}")
-        
         # The second region, 12x5: 1 0 1 0 2 2, is 12 units wide 
         # and 5 units long. In that region, you need to try to fit 
         # one present with shape index 0, one present 
@@ -320,7 +278,7 @@ class Day12(BaseChallenge):
         # simplified brute force manner, 
         # since optimization is not the focus here for now.
         # Precompute cells/orientations/areas per shape.
-        shapes, regions = _parse_input(data)
+        shapes, regions = data
         base_cells = [_shape_cells(g) for g in shapes]
         shape_areas = [len(c) for c in base_cells]
         shape_orients = [_orientations(c) for c in base_cells]
@@ -331,7 +289,7 @@ class Day12(BaseChallenge):
                 ok += 1
         return str(ok)
 
-    def solve_part2(self, data: list[str]) -> str:
+    def solve_part2(self, data: tuple[list[list[str]], list[tuple[int, int, list[int]]]]) -> str:
         # TODO: implement part 2
         return "not implemented"
 